@@ -6,7 +6,7 @@ Run with: python -m mapper
 
 import tkinter as tk
 
-from mapper.editor import Mapper
+from mapper.editor import Mapper, clear_atlas_cache
 
 
 def main() -> None:
@@ -15,6 +15,7 @@ def main() -> None:
     root.geometry("1024x768")
     Mapper(root)
     root.mainloop()
+    clear_atlas_cache()
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ Represents an NPC placement on the map.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """
     Represents an NPC placement.
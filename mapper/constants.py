@@ -2,22 +2,33 @@
 Shared constants for the Mapper application.
 """
 
+from typing import Final
+
 # Sprite dimensions
-SPRITE_SIZE: int = 16
-SCALE_FACTOR: int = 4
-DISPLAY_SIZE: int = SPRITE_SIZE * SCALE_FACTOR  # 64 pixels on screen
+SPRITE_SIZE: Final[int] = 16
+SCALE_FACTOR: Final[int] = 4
+DISPLAY_SIZE: Final[int] = SPRITE_SIZE * SCALE_FACTOR  # 64 pixels on screen
 
 # World coordinate system: centered on (0,0)
 # Supports tiles from -WORLD_OFFSET to +WORLD_OFFSET-1 in each axis
-WORLD_OFFSET: int = 512
-WORLD_SIZE: int = WORLD_OFFSET * 2  # 1024 tiles total
+WORLD_OFFSET: Final[int] = 512
+WORLD_SIZE: Final[int] = WORLD_OFFSET * 2  # 1024 tiles total
+WORLD_PIXEL_OFFSET: Final[int] = WORLD_OFFSET * DISPLAY_SIZE  # Canvas pixel of world 0
 
 # Grid display range (centered on origin)
-GRID_RANGE: int = 64
+GRID_RANGE: Final[int] = 64
+
+# First characters of a line in the tab-separated text files (.map, .tiles)
+# that may make it blank or a comment; any other line is a data row and can
+# skip the full strip
+BLANK_OR_COMMENT_START: Final[str] = " \t\r\x0b\x0c#"
+
+# Spatial index bucket size: tiles are grouped into 32x32 chunks
+CHUNK_SHIFT: Final[int] = 5
 
 # Fixed color palette (RGB tuples)
 # Used for clear color and any other palette-based color selection
-PALETTE: list[tuple[int, int, int]] = [
+PALETTE: Final[list[tuple[int, int, int]]] = [
     (22, 13, 19),
     (49, 41, 62),
     (77, 102, 96),
@@ -34,4 +45,6 @@ PALETTE: list[tuple[int, int, int]] = [
     (155, 76, 99),
     (67, 33, 66),
     (209, 147, 95),
-]
\ No newline at end of file
+]
+# PALETTE as lowercase hex color strings (e.g. "#160d13")
+PALETTE_HEX: Final[tuple[str, ...]] = tuple(f"#{r:02x}{g:02x}{b:02x}" for r, g, b in PALETTE)
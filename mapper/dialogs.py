@@ -7,7 +7,7 @@ from __future__ import annotations
 import tkinter as tk
 from typing import TYPE_CHECKING
 
-from mapper.constants import PALETTE
+from mapper.constants import PALETTE_HEX
 
 if TYPE_CHECKING:
     pass
@@ -97,12 +97,12 @@ class ColorPickerDialog(tk.Toplevel):
         palette_frame = tk.Frame(self)
         palette_frame.pack(pady=10, padx=10)
 
-        for idx, rgb in enumerate(PALETTE):
+        current_lower = self._current_color.lower()
+
+        for idx, hex_color in enumerate(PALETTE_HEX):
             row = idx // self.SWATCHES_PER_ROW
             col = idx % self.SWATCHES_PER_ROW
 
-            hex_color = rgb_to_hex(rgb)
-
             swatch = tk.Canvas(
                 palette_frame,
                 width=self.SWATCH_SIZE,
@@ -117,7 +117,7 @@ class ColorPickerDialog(tk.Toplevel):
             swatch.bind("<Button-1>", lambda e, c=hex_color: self._select_color(c))
 
             # Highlight if this is the current color
-            if hex_color.lower() == self._current_color.lower():
+            if hex_color == current_lower:
                 swatch.configure(highlightbackground="#ffff00", highlightthickness=3)
 
         # Cancel button
@@ -9,35 +9,78 @@ from __future__ import annotations
 
 import os
 import tkinter as tk
+from array import array
+from collections import OrderedDict
+from functools import partial
 from tkinter import filedialog, messagebox, simpledialog
-from typing import TYPE_CHECKING
-
-from PIL import Image, ImageTk
+from typing import TYPE_CHECKING, Callable
 
 from mapper.character import Character
 from mapper.constants import (
+    CHUNK_SHIFT,
     DISPLAY_SIZE,
     GRID_RANGE,
+    SCALE_FACTOR,
     SPRITE_SIZE,
     WORLD_OFFSET,
+    WORLD_PIXEL_OFFSET,
     WORLD_SIZE,
 )
 from mapper.dialogs import ColorPickerDialog
-from mapper.map_io import load_map, save_map
-from mapper.modes import (
-    BlockedMode,
-    CharacterMode,
-    EditorMode,
-    ExamineMode,
-    PaintTileMode,
-    SpawnMode,
+from mapper.map_io import (
+    BINARY_MAP_EXTENSION, load_map, load_map_bin, save_map, save_map_bin, tile_bounds
 )
 from mapper.monsterspawn import MonsterSpawn
 from mapper.tile import Tile
 from mapper.tile_defaults import TileDefaults, load_tile_defaults
 
+# PIL and the mode classes are imported where first used, so the window can
+# come up before they load
 if TYPE_CHECKING:
-    pass
+    from PIL import Image
+
+    from mapper.modes import EditorMode
+
+    # Atlas image, unscaled PIL tiles, scaled Tk tiles
+    _AtlasEntry = tuple[Image.Image, dict[int, Image.Image], dict[int, tk.PhotoImage]]
+
+# Recently loaded atlases keyed by (absolute path, mtime), oldest first.
+# Tk images belong to the root they were created under: call
+# clear_atlas_cache() once that root is destroyed.
+_ATLAS_CACHE: OrderedDict[tuple[str, float], _AtlasEntry] = OrderedDict()
+_ATLAS_CACHE_SIZE = 4
+
+# File dialog choices for map load/save; the extension picks the format
+_MAP_FILETYPES = [
+    ("Map files", "*.map"),
+    ("Binary map files", "*" + BINARY_MAP_EXTENSION),
+    ("All files", "*.*")
+]
+
+
+def _w2c(world: int) -> int:
+    """Convert a world tile coordinate to a canvas pixel (same for both axes)."""
+    return world * DISPLAY_SIZE + WORLD_PIXEL_OFFSET
+
+
+def _c2w(canvas: float) -> int:
+    """Convert a canvas pixel to a world tile coordinate (same for both axes)."""
+    return int(canvas) // DISPLAY_SIZE - WORLD_OFFSET
+
+
+def _grid_index(world_x: int, world_y: int) -> int:
+    """Index of an in-world tile in Mapper.sprite_grid."""
+    return (world_y + WORLD_OFFSET) * WORLD_SIZE + world_x + WORLD_OFFSET
+
+
+def _empty_sprite_grid() -> array[int]:
+    """Create a sprite grid with no tiles."""
+    return array("i", [-1]) * (WORLD_SIZE * WORLD_SIZE)
+
+
+def clear_atlas_cache() -> None:
+    """Drop all cached atlases (and the Tk images they hold)."""
+    _ATLAS_CACHE.clear()
 
 
 class Mapper:
@@ -55,7 +98,7 @@ class Mapper:
         # Atlas state
         self.atlas_path: str | None = None
         self.atlas_image: Image.Image | None = None
-        self.tile_images: dict[int, ImageTk.PhotoImage] = {}
+        self.tile_images: dict[int, tk.PhotoImage] = {}
         self.tile_pil_images: dict[int, Image.Image] = {}
         self.tile_defaults: dict[int, TileDefaults] = {}
 
@@ -65,27 +108,59 @@ class Mapper:
         self.spawns: dict[tuple[int, int], MonsterSpawn] = {}
         self.characters: dict[tuple[int, int], Character] = {}
 
+        # Spatial index over self.tiles (see set_tile)
+        self._chunks: dict[tuple[int, int], set[tuple[int, int]]] = {}
+        self._bbox: tuple[int, int, int, int] | None = None  # min_x, min_y, max_x, max_y
+        self.blocked_count: int = 0  # Tiles with blocked set; modes that toggle it adjust this
+        self.examine_coords: set[tuple[int, int]] = set()  # Tiles with examine text; modes that edit it keep this in sync
+
+        # Sprite of every in-world cell, row-major from (-WORLD_OFFSET, -WORLD_OFFSET),
+        # -1 where there is no tile. Mirrors self.tiles for per-cell reads on hot
+        # paths (see sprite_at); self.tiles stays the source of truth.
+        self.sprite_grid: array[int] = _empty_sprite_grid()
+
         # Map metadata
         self.map_name: str = "Untitled"
         self.clear_color: str = "#000000"
 
         # Navigation state
         self._is_panning: bool = False
+        # Modifier held for click-drag panning: Command on macOS, Ctrl elsewhere
+        windowing_system = self.root.tk.call("tk", "windowingsystem")
+        self._pan_mask: int = 0x0008 if windowing_system == "aqua" else 0x0004
+
+        # Input state: whether a text-entry widget has keyboard focus
+        self._focus_is_text: bool = False
+
+        # Rendering state: canvas image item for each drawn tile
+        self._tile_item_ids: dict[tuple[int, int], int] = {}
+        self._visible_redraw_pending: bool = False
+        self._dirty_tiles: set[tuple[int, int]] = set()
+        self._dirty_flush_pending: bool = False
 
         # Mode system
         self._modes: dict[str, EditorMode] = {}
-        self._mode_keys: dict[str, str] = {}  # hotkey -> mode_name
+        self._hotkey_dispatch: dict[str, Callable[[], None]] = {}  # hotkey -> set_mode call
         self._current_mode: EditorMode | None = None
         self._current_mode_name: str | None = None
 
         # UI references
         self._left_panel_container: tk.Frame | None = None
         self._current_panel: tk.Frame | None = None
+        self._panels: dict[str, tk.Frame | None] = {}  # Built on first use, kept while hidden
         self.map_canvas: tk.Canvas | None = None
+        self._scrollbar_h: tk.Scrollbar | None = None
+        self._scrollbar_v: tk.Scrollbar | None = None
+        self._grid_bg: tk.PhotoImage | None = None
+        self._grid_bg_item: int | None = None
+        self._grid_bg_key: tuple[int, ...] | None = None
         self._status_var: tk.StringVar | None = None
 
         self._setup_ui()
-        self._setup_modes()
+
+        # Load the mode classes once the window is up; until then the editor
+        # has no current mode, which every handler already allows for
+        self.root.after_idle(self._setup_modes)
 
     # =========================================================================
     # Mode System
@@ -93,6 +168,14 @@ class Mapper:
 
     def _setup_modes(self) -> None:
         """Register all editor modes."""
+        from mapper.modes import (
+            BlockedMode,
+            CharacterMode,
+            ExamineMode,
+            PaintTileMode,
+            SpawnMode,
+        )
+
         self._register_mode("paint", PaintTileMode(self), "p")
         self._register_mode("blocked", BlockedMode(self), "b")
         self._register_mode("examine", ExamineMode(self), "e")
@@ -109,7 +192,7 @@ class Mapper:
         """Register an editor mode with optional hotkey."""
         self._modes[name] = mode
         if hotkey:
-            self._mode_keys[hotkey.lower()] = name
+            self._hotkey_dispatch[hotkey.lower()] = partial(self.set_mode, name)
 
     def set_mode(self, name: str) -> None:
         """Switch to a different editor mode."""
@@ -123,21 +206,42 @@ class Mapper:
         self._current_mode = self._modes[name]
         self._current_mode.on_activate()
 
-        self._rebuild_panel()
+        self._show_panel()
         self._refresh_overlay()
         self.update_status()
 
-    def _rebuild_panel(self) -> None:
-        """Rebuild the left panel for the current mode."""
+    def _show_panel(self) -> None:
+        """Show the left panel for the current mode, building it on first use."""
         if self._current_panel:
-            self._current_panel.destroy()
+            self._current_panel.pack_forget()
             self._current_panel = None
+            # A hidden text widget may not report losing focus
+            self.map_canvas.focus_set()
+            self._focus_is_text = False
 
         if self._current_mode:
-            self._current_panel = self._current_mode.build_panel(self._left_panel_container)
+            name = self._current_mode_name
+            if name not in self._panels:
+                self._panels[name] = self._current_mode.build_panel(self._left_panel_container)
+
+            self._current_panel = self._panels[name]
             if self._current_panel:
                 self._current_panel.pack(fill=tk.BOTH, expand=True)
 
+    def _rebuild_panel(self) -> None:
+        """Discard all built panels (e.g. after an atlas change) and show the current one."""
+        if self._current_panel:
+            self._current_panel.pack_forget()
+            self._current_panel = None
+            self._focus_is_text = False
+
+        for panel in self._panels.values():
+            if panel:
+                panel.destroy()
+        self._panels.clear()
+
+        self._show_panel()
+
     def _refresh_overlay(self) -> None:
         """Refresh mode-specific overlay on map canvas."""
         self.map_canvas.delete("overlay")
@@ -168,8 +272,7 @@ class Mapper:
         self._setup_status_bar()
         self._setup_bindings()
 
-        # Draw grid and center view
-        self._draw_map_grid()
+        # Center view (the grid is drawn once the canvas reports its size)
         self.root.after(100, lambda: self.center_view_on(0, 0))
 
     def _setup_menu(self) -> None:
@@ -215,23 +318,25 @@ class Mapper:
             scrollregion=(0, 0, WORLD_SIZE * DISPLAY_SIZE, WORLD_SIZE * DISPLAY_SIZE)
         )
 
-        scrollbar_v = tk.Scrollbar(
+        self._scrollbar_v = tk.Scrollbar(
             map_container,
             orient=tk.VERTICAL,
             command=self.map_canvas.yview
         )
-        scrollbar_h = tk.Scrollbar(
+        self._scrollbar_h = tk.Scrollbar(
             map_container,
             orient=tk.HORIZONTAL,
             command=self.map_canvas.xview
         )
+        # Any view change (scrollbar, pan, xview_moveto) reports through these,
+        # so they double as the hook for drawing newly exposed tiles
         self.map_canvas.configure(
-            yscrollcommand=scrollbar_v.set,
-            xscrollcommand=scrollbar_h.set
+            yscrollcommand=self._on_map_yscroll,
+            xscrollcommand=self._on_map_xscroll
         )
 
-        scrollbar_v.pack(side=tk.RIGHT, fill=tk.Y)
-        scrollbar_h.pack(side=tk.BOTTOM, fill=tk.X)
+        self._scrollbar_v.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar_h.pack(side=tk.BOTTOM, fill=tk.X)
         self.map_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
     def _setup_status_bar(self) -> None:
@@ -251,7 +356,10 @@ class Mapper:
         self.map_canvas.bind("<B1-Motion>", self._on_map_drag)
         self.map_canvas.bind("<ButtonRelease-1>", self._on_map_release)
         self.map_canvas.bind("<Button-3>", self._on_map_right_click)
+        self.map_canvas.bind("<Configure>", self._on_map_configure)
         self.root.bind("<Key>", self._on_key)
+        self.root.bind("<FocusIn>", self._on_focus_in)
+        self.root.bind("<FocusOut>", self._on_focus_out)
 
     # =========================================================================
     # Event Handlers
@@ -259,19 +367,28 @@ class Mapper:
 
     def _on_key(self, event: tk.Event) -> None:
         """Handle hotkey presses."""
+        callback = self._hotkey_dispatch.get(event.char.lower())
+        if callback is None:
+            return
 
         # Ignore hotkeys when typing in a text widget
-        if isinstance(self.root.focus_get(), (tk.Text, tk.Entry)):
+        if self._focus_is_text:
             return
 
-        key = event.char.lower()
-        if key in self._mode_keys:
-            self.set_mode(self._mode_keys[key])
+        callback()
+
+    def _on_focus_in(self, event: tk.Event) -> None:
+        """Track whether keyboard focus is in a text-entry widget."""
+        self._focus_is_text = isinstance(event.widget, (tk.Text, tk.Entry))
+
+    def _on_focus_out(self, event: tk.Event) -> None:
+        """Clear text focus tracking when a widget loses focus."""
+        self._focus_is_text = False
 
     def _on_map_click(self, event: tk.Event) -> None:
         """Handle map click (delegate to mode or pan)."""
-        # Check for Ctrl key (pan mode)
-        if event.state & 0x0004:
+        # Check for pan modifier key
+        if event.state & self._pan_mask:
             self._is_panning = True
             self.map_canvas.scan_mark(event.x, event.y)
             self.map_canvas.config(cursor="fleur")
@@ -309,11 +426,25 @@ class Mapper:
         world_x, world_y = self._event_to_world(event)
         self._current_mode.on_map_right_click(world_x, world_y, event)
 
+    def _on_map_xscroll(self, first: str, last: str) -> None:
+        """Update the horizontal scrollbar and draw newly exposed tiles."""
+        self._scrollbar_h.set(first, last)
+        self._schedule_visible_redraw()
+
+    def _on_map_yscroll(self, first: str, last: str) -> None:
+        """Update the vertical scrollbar and draw newly exposed tiles."""
+        self._scrollbar_v.set(first, last)
+        self._schedule_visible_redraw()
+
+    def _on_map_configure(self, event: tk.Event) -> None:
+        """Draw tiles exposed by a resize of the map canvas."""
+        self._schedule_visible_redraw()
+
     def _event_to_world(self, event: tk.Event) -> tuple[int, int]:
         """Convert a mouse event to world tile coordinates."""
         cx = self.map_canvas.canvasx(event.x)
         cy = self.map_canvas.canvasy(event.y)
-        return self.canvas_to_world_x(cx), self.canvas_to_world_y(cy)
+        return _c2w(cx), _c2w(cy)
 
     # =========================================================================
     # Coordinate Conversion
@@ -321,27 +452,27 @@ class Mapper:
 
     def world_to_canvas_x(self, world_x: int) -> int:
         """Convert world tile X to canvas pixel X."""
-        return (world_x + WORLD_OFFSET) * DISPLAY_SIZE
+        return _w2c(world_x)
 
     def world_to_canvas_y(self, world_y: int) -> int:
         """Convert world tile Y to canvas pixel Y."""
-        return (world_y + WORLD_OFFSET) * DISPLAY_SIZE
+        return _w2c(world_y)
 
     def canvas_to_world_x(self, canvas_x: float) -> int:
         """Convert canvas pixel X to world tile X."""
-        return int(canvas_x) // DISPLAY_SIZE - WORLD_OFFSET
+        return _c2w(canvas_x)
 
     def canvas_to_world_y(self, canvas_y: float) -> int:
         """Convert canvas pixel Y to world tile Y."""
-        return int(canvas_y) // DISPLAY_SIZE - WORLD_OFFSET
+        return _c2w(canvas_y)
 
     def center_view_on(self, world_x: int, world_y: int) -> None:
         """Center the map view on a world coordinate."""
         # Ensure geometry is calculated
         self.map_canvas.update_idletasks()
 
-        canvas_x = self.world_to_canvas_x(world_x)
-        canvas_y = self.world_to_canvas_y(world_y)
+        canvas_x = _w2c(world_x)
+        canvas_y = _w2c(world_y)
 
         total_size = WORLD_SIZE * DISPLAY_SIZE
 
@@ -357,36 +488,169 @@ class Mapper:
         self.map_canvas.xview_moveto(max(0.0, min(1.0, frac_x)))
         self.map_canvas.yview_moveto(max(0.0, min(1.0, frac_y)))
 
+    # =========================================================================
+    # Tile Storage
+    # =========================================================================
+
+    def set_tile(self, tile_x: int, tile_y: int, tile: Tile) -> None:
+        """Place a tile, keeping the spatial index, sprite grid, bounds, blocked count and examine set up to date."""
+        coords = (tile_x, tile_y)
+        old = self.tiles.get(coords)
+        self.tiles[coords] = tile
+
+        # Map files may hold tiles outside the paintable world; those stay off the grid
+        if -WORLD_OFFSET <= tile_x < WORLD_OFFSET and -WORLD_OFFSET <= tile_y < WORLD_OFFSET:
+            self.sprite_grid[_grid_index(tile_x, tile_y)] = tile.sprite
+
+        if old is not None and old.blocked:
+            self.blocked_count -= 1
+        if tile.blocked:
+            self.blocked_count += 1
+        if tile.examine_text is not None:
+            self.examine_coords.add(coords)
+        else:
+            self.examine_coords.discard(coords)
+
+        chunk = (tile_x >> CHUNK_SHIFT, tile_y >> CHUNK_SHIFT)
+        bucket = self._chunks.get(chunk)
+        if bucket is None:
+            self._chunks[chunk] = {coords}
+        else:
+            bucket.add(coords)
+
+        bbox = self._bbox
+        if bbox is None:
+            self._bbox = (tile_x, tile_y, tile_x, tile_y)
+        else:
+            self._bbox = (
+                min(bbox[0], tile_x), min(bbox[1], tile_y),
+                max(bbox[2], tile_x), max(bbox[3], tile_y)
+            )
+
+    def sprite_at(self, tile_x: int, tile_y: int) -> int:
+        """Return the sprite of the tile at the given coordinates, or -1 if there is none or they are outside the world."""
+        if -WORLD_OFFSET <= tile_x < WORLD_OFFSET and -WORLD_OFFSET <= tile_y < WORLD_OFFSET:
+            return self.sprite_grid[_grid_index(tile_x, tile_y)]
+        return -1
+
+    def _reset_tiles(self, tiles: dict[tuple[int, int], Tile]) -> None:
+        """Replace all tiles and rebuild the spatial index, sprite grid, bounds, blocked count and examine set in one pass."""
+        self.tiles.clear()
+        self.tiles.update(tiles)
+
+        chunks = self._chunks
+        chunks.clear()
+        grid = self.sprite_grid = _empty_sprite_grid()
+        examine_coords = self.examine_coords
+        examine_coords.clear()
+        blocked_count = 0
+
+        # Same bookkeeping as set_tile, without its per-tile bounds tuple and
+        # lookups of the previous tile
+        for coords, tile in tiles.items():
+            x, y = coords
+            chunk = (x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+            bucket = chunks.get(chunk)
+            if bucket is None:
+                chunks[chunk] = {coords}
+            else:
+                bucket.add(coords)
+
+            if tile.blocked:
+                blocked_count += 1
+            if tile.examine_text is not None:
+                examine_coords.add(coords)
+
+            grid_x = x + WORLD_OFFSET
+            grid_y = y + WORLD_OFFSET
+            if 0 <= grid_x < WORLD_SIZE and 0 <= grid_y < WORLD_SIZE:
+                grid[grid_y * WORLD_SIZE + grid_x] = tile.sprite
+
+        self.blocked_count = blocked_count
+        self._bbox = tile_bounds(tiles) if tiles else None
+
     # =========================================================================
     # Map Grid
     # =========================================================================
 
     def _draw_map_grid(self) -> None:
-        """Draw a subtle grid on the map canvas."""
+        """
+        Draw a subtle grid on the map canvas.
+
+        The grid lines in view are rendered into a single background image
+        one tile larger than the viewport. Grid lines repeat every tile, so
+        scrolling only moves that image; it is re-rendered when the viewport
+        is resized or the edge of the grid range comes into view. The origin
+        crosshair does not repeat, so it is drawn as two fixed line items
+        just above the image.
+        """
+        canvas = self.map_canvas
+
+        # Tile-aligned world rect covered by the background image
+        left = _c2w(canvas.canvasx(0))
+        top = _c2w(canvas.canvasy(0))
+        cols = canvas.winfo_width() // DISPLAY_SIZE + 2
+        rows = canvas.winfo_height() // DISPLAY_SIZE + 2
+
+        # Part of the grid range inside it
+        x0 = max(left, -GRID_RANGE)
+        x1 = min(left + cols, GRID_RANGE)
+        y0 = max(top, -GRID_RANGE)
+        y1 = min(top + rows, GRID_RANGE)
+
+        key = (cols, rows, x0 - left, x1 - left, y0 - top, y1 - top)
+        if key != self._grid_bg_key:
+            self._grid_bg_key = key
+            self._grid_bg = self._render_grid(left, top, cols, rows, x0, x1, y0, y1)
+            if self._grid_bg_item is None:
+                self._grid_bg_item = canvas.create_image(
+                    0, 0, anchor=tk.NW, image=self._grid_bg, tags="grid"
+                )
+                # Origin crosshair (brighter)
+                origin = _w2c(0)
+                start = _w2c(-GRID_RANGE)
+                end = _w2c(GRID_RANGE)
+                canvas.create_line(origin, start, origin, end, fill="#444", tags=("grid", "origin"))
+                canvas.create_line(start, origin, end, origin, fill="#444", tags=("grid", "origin"))
+                canvas.tag_lower("origin")
+                canvas.tag_lower(self._grid_bg_item)
+            else:
+                canvas.itemconfigure(self._grid_bg_item, image=self._grid_bg)
+
+        canvas.coords(self._grid_bg_item, _w2c(left), _w2c(top))
+
+    def _render_grid(
+        self, left: int, top: int, cols: int, rows: int,
+        x0: int, x1: int, y0: int, y1: int
+    ) -> tk.PhotoImage:
+        """
+        Render grid lines x0..x1 / y0..y1 into an image whose top-left is world (left, top).
+
+        Uses a plain Tk image, which starts out transparent, so the first
+        redraw does not have to wait for PIL.
+        """
+        img = tk.PhotoImage(
+            master=self.root, width=cols * DISPLAY_SIZE + 1, height=rows * DISPLAY_SIZE + 1
+        )
+        if x0 > x1 or y0 > y1:
+            return img
+
+        px_start = (x0 - left) * DISPLAY_SIZE
+        px_end = (x1 - left) * DISPLAY_SIZE
+        py_start = (y0 - top) * DISPLAY_SIZE
+        py_end = (y1 - top) * DISPLAY_SIZE
+
         # Vertical lines
-        for i in range(-GRID_RANGE, GRID_RANGE + 1):
-            cx = self.world_to_canvas_x(i)
-            cy_start = self.world_to_canvas_y(-GRID_RANGE)
-            cy_end = self.world_to_canvas_y(GRID_RANGE)
-            self.map_canvas.create_line(cx, cy_start, cx, cy_end, fill="#2a2a2a", tags="grid")
+        for i in range(x0, x1 + 1):
+            px = (i - left) * DISPLAY_SIZE
+            img.put("#2a2a2a", to=(px, py_start, px + 1, py_end + 1))
 
         # Horizontal lines
-        for i in range(-GRID_RANGE, GRID_RANGE + 1):
-            cy = self.world_to_canvas_y(i)
-            cx_start = self.world_to_canvas_x(-GRID_RANGE)
-            cx_end = self.world_to_canvas_x(GRID_RANGE)
-            self.map_canvas.create_line(cx_start, cy, cx_end, cy, fill="#2a2a2a", tags="grid")
-
-        # Origin crosshair (brighter)
-        origin_x = self.world_to_canvas_x(0)
-        origin_y = self.world_to_canvas_y(0)
-        cy_start = self.world_to_canvas_y(-GRID_RANGE)
-        cy_end = self.world_to_canvas_y(GRID_RANGE)
-        cx_start = self.world_to_canvas_x(-GRID_RANGE)
-        cx_end = self.world_to_canvas_x(GRID_RANGE)
-
-        self.map_canvas.create_line(origin_x, cy_start, origin_x, cy_end, fill="#444", tags="grid")
-        self.map_canvas.create_line(cx_start, origin_y, cx_end, origin_y, fill="#444", tags="grid")
+        for i in range(y0, y1 + 1):
+            py = (i - top) * DISPLAY_SIZE
+            img.put("#2a2a2a", to=(px_start, py, px_end + 1, py + 1))
+
+        return img
 
     # =========================================================================
     # Atlas Loading
@@ -401,61 +665,104 @@ class Mapper:
         if not path:
             return
 
+        try:
+            cache_key = (os.path.abspath(path), os.path.getmtime(path))
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to load image: {e}")
+            return
+
+        cached = _ATLAS_CACHE.get(cache_key)
+        if cached is not None:
+            _ATLAS_CACHE.move_to_end(cache_key)
+        else:
+            cached = self._build_atlas(path)
+            if cached is None:
+                return
+            _ATLAS_CACHE[cache_key] = cached
+            if len(_ATLAS_CACHE) > _ATLAS_CACHE_SIZE:
+                _ATLAS_CACHE.popitem(last=False)
+
+        # Store atlas (the cached dicts are shared, so replace rather than mutate)
+        self.atlas_path = path
+        self.atlas_image, self.tile_pil_images, self.tile_images = cached
+        tile_count = len(self.tile_images)
+
+        # Load tile defaults from companion file
+        self.tile_defaults = load_tile_defaults(path)
+        defaults_count = len(self.tile_defaults)
+
+        self.brush = 0
+        self._rebuild_panel()
+
+        if defaults_count > 0:
+            self.update_status(
+                f"Loaded atlas: {os.path.basename(path)} ({tile_count} tiles, {defaults_count} defaults)"
+            )
+        else:
+            self.update_status(f"Loaded atlas: {os.path.basename(path)} ({tile_count} tiles, no .tiles file)")
+
+    def _build_atlas(self, path: str) -> _AtlasEntry | None:
+        """
+        Open and validate an atlas PNG, then slice it into tiles.
+
+        Returns:
+            The atlas image with its unscaled PIL tiles and scaled Tk tiles,
+            or None if the image could not be used (an error has been shown).
+        """
+        from PIL import Image, ImageTk
+
         try:
             img = Image.open(path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {e}")
-            return
+            return None
 
         # Validate atlas dimensions
         width, height = img.size
         if width != height:
             messagebox.showerror("Error", "Atlas must be square")
-            return
+            return None
         if width & (width - 1) != 0:
             messagebox.showerror("Error", "Atlas dimensions must be power of 2")
-            return
+            return None
         if width % SPRITE_SIZE != 0:
             messagebox.showerror("Error", f"Atlas size must be multiple of {SPRITE_SIZE}")
-            return
+            return None
 
         if img.mode != "RGBA":
             img = img.convert("RGBA")
 
-        # Store atlas
-        self.atlas_path = path
-        self.atlas_image = img
-        self.tile_images.clear()
-        self.tile_pil_images.clear()
+        tile_pil_images: dict[int, Image.Image] = {}
+        tile_images: dict[int, tk.PhotoImage] = {}
 
         # Extract tiles
         tiles_per_row = width // SPRITE_SIZE
         tile_count = tiles_per_row * tiles_per_row
 
+        # NEAREST upscaling is plain pixel replication, so scale the whole
+        # atlas in one PIL call and upload it to Tk once; Tk then slices out
+        # each display tile natively
+        scaled = img.resize((width * SCALE_FACTOR, height * SCALE_FACTOR), Image.NEAREST)
+        atlas_tk = ImageTk.PhotoImage(scaled)
+        atlas_name = str(atlas_tk)
+
         for idx in range(tile_count):
             tx = (idx % tiles_per_row) * SPRITE_SIZE
             ty = (idx // tiles_per_row) * SPRITE_SIZE
+            sx = tx * SCALE_FACTOR
+            sy = ty * SCALE_FACTOR
 
             tile_pil = img.crop((tx, ty, tx + SPRITE_SIZE, ty + SPRITE_SIZE))
-            tile_scaled = tile_pil.resize((DISPLAY_SIZE, DISPLAY_SIZE), Image.NEAREST)
-            tile_tk = ImageTk.PhotoImage(tile_scaled)
-
-            self.tile_pil_images[idx] = tile_pil
-            self.tile_images[idx] = tile_tk
+            tile_tk = tk.PhotoImage(master=self.root, width=DISPLAY_SIZE, height=DISPLAY_SIZE)
+            tile_tk.tk.call(
+                tile_tk, "copy", atlas_name,
+                "-from", sx, sy, sx + DISPLAY_SIZE, sy + DISPLAY_SIZE
+            )
 
-        # Load tile defaults from companion file
-        self.tile_defaults = load_tile_defaults(path)
-        defaults_count = len(self.tile_defaults)
+            tile_pil_images[idx] = tile_pil
+            tile_images[idx] = tile_tk
 
-        self.brush = 0
-        self._rebuild_panel()
-
-        if defaults_count > 0:
-            self.update_status(
-                f"Loaded atlas: {os.path.basename(path)} ({tile_count} tiles, {defaults_count} defaults)"
-            )
-        else:
-            self.update_status(f"Loaded atlas: {os.path.basename(path)} ({tile_count} tiles, no .tiles file)")
+        return img, tile_pil_images, tile_images
 
     # =========================================================================
     # Map Properties
@@ -496,21 +803,27 @@ class Mapper:
 
         path = filedialog.askopenfilename(
             title="Load Map",
-            filetypes=[("Map files", "*.map"), ("All files", "*.*")]
+            filetypes=_MAP_FILETYPES
         )
         if not path:
             return
 
         try:
             valid_indices = set(self.tile_images.keys())
-            map_data = load_map(path, valid_indices)
+            load = load_map_bin if path.endswith(BINARY_MAP_EXTENSION) else load_map
+            map_data = load(path, valid_indices)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read file: {e}")
             return
 
+        # Modes hold selections, queued edits and overlay item ids for the
+        # old map; leave the current one before replacing the data
+        mode = self._current_mode
+        if mode:
+            mode.on_deactivate()
+
         # Update state
-        self.tiles.clear()
-        self.tiles.update(map_data.tiles)
+        self._reset_tiles(map_data.tiles)
         self.spawns.clear()
         self.spawns.update(map_data.spawns)
         self.characters.clear()
@@ -520,15 +833,15 @@ class Mapper:
         self.map_name = map_data.name
         self.clear_color = map_data.clear_color
 
-        # Redraw
+        # Redraw, re-entering the mode so its overlay is rebuilt from the new data
         self._redraw_map_tiles()
+        if mode:
+            mode.on_activate()
+        self._refresh_overlay()
 
         # Center view on map
-        if self.tiles:
-            min_x = min(x for x, y in self.tiles.keys())
-            max_x = max(x for x, y in self.tiles.keys())
-            min_y = min(y for x, y in self.tiles.keys())
-            max_y = max(y for x, y in self.tiles.keys())
+        if self._bbox is not None:
+            min_x, min_y, max_x, max_y = self._bbox
             center_x = (min_x + max_x) // 2
             center_y = (min_y + max_y) // 2
             self.center_view_on(center_x, center_y)
@@ -543,19 +856,111 @@ class Mapper:
         )
 
     def _redraw_map_tiles(self) -> None:
-        """Clear and redraw all tiles on the map canvas."""
+        """Clear the map canvas and redraw the tiles in the viewport."""
         self.map_canvas.delete("maptile")
+        self._tile_item_ids.clear()
+        self._draw_visible_tiles()
 
-        for (x, y), tile in self.tiles.items():
-            if tile.sprite in self.tile_images:
-                px = self.world_to_canvas_x(x)
-                py = self.world_to_canvas_y(y)
-                self.map_canvas.create_image(
-                    px, py,
-                    anchor=tk.NW,
-                    image=self.tile_images[tile.sprite],
-                    tags=("maptile", f"maptile_{x}_{y}")
-                )
+    def _schedule_visible_redraw(self) -> None:
+        """Redraw the grid and newly exposed tiles once the current burst of view changes settles."""
+        if self._visible_redraw_pending:
+            return
+        self._visible_redraw_pending = True
+        self.root.after_idle(self._redraw_view)
+
+    def _redraw_view(self) -> None:
+        """Bring the grid and tiles up to date with the current view."""
+        self._visible_redraw_pending = False
+        self._draw_map_grid()
+        self._draw_visible_tiles()
+
+    def _visible_world_rect(self) -> tuple[int, int, int, int]:
+        """Return the (min_x, min_y, max_x, max_y) world tiles in view, padded by one."""
+        canvas = self.map_canvas
+        x0 = _c2w(canvas.canvasx(0)) - 1
+        y0 = _c2w(canvas.canvasy(0)) - 1
+        x1 = _c2w(canvas.canvasx(canvas.winfo_width())) + 1
+        y1 = _c2w(canvas.canvasy(canvas.winfo_height())) + 1
+        return x0, y0, x1, y1
+
+    def _draw_visible_tiles(self) -> None:
+        """Create canvas items for visible tiles that are not drawn yet."""
+
+        x0, y0, x1, y1 = self._visible_world_rect()
+        drawn = self._tile_item_ids
+        drawn_before = len(drawn)
+
+        # Only visit the spatial index chunks that intersect the view
+        for chunk_y in range(y0 >> CHUNK_SHIFT, (y1 >> CHUNK_SHIFT) + 1):
+            for chunk_x in range(x0 >> CHUNK_SHIFT, (x1 >> CHUNK_SHIFT) + 1):
+                bucket = self._chunks.get((chunk_x, chunk_y))
+                if not bucket:
+                    continue
+
+                for coords in bucket:
+                    x, y = coords
+                    if not (x0 <= x <= x1 and y0 <= y <= y1) or coords in drawn:
+                        continue
+                    tile = self.tiles[coords]
+                    if tile.sprite in self.tile_images:
+                        self._create_tile_item(x, y, tile.sprite)
+
+        # Keep mode overlays above tiles drawn after them
+        if len(drawn) != drawn_before:
+            self.map_canvas.tag_raise("overlay")
+
+    def _create_tile_item(self, x: int, y: int, sprite: int) -> None:
+        """Create the canvas item for a single tile."""
+        px = _w2c(x)
+        py = _w2c(y)
+        self._tile_item_ids[(x, y)] = self.map_canvas.create_image(
+            px, py,
+            anchor=tk.NW,
+            image=self.tile_images[sprite],
+            tags="maptile"
+        )
+
+    def paint_tile(self, tile_x: int, tile_y: int, tile: Tile) -> None:
+        """Place a tile and schedule its canvas image to be updated."""
+        self.set_tile(tile_x, tile_y, tile)
+        self.mark_dirty(tile_x, tile_y)
+
+    def mark_dirty(self, tile_x: int, tile_y: int) -> None:
+        """
+        Queue a tile's canvas image for update.
+
+        All tiles marked during one pass of the Tk event loop are flushed
+        together once it goes idle.
+        """
+        self._dirty_tiles.add((tile_x, tile_y))
+        if not self._dirty_flush_pending:
+            self._dirty_flush_pending = True
+            self.root.after_idle(self._flush_dirty)
+
+    def _flush_dirty(self) -> None:
+        """Bring the canvas items of all dirty tiles up to date."""
+        self._dirty_flush_pending = False
+        created = False
+
+        for coords in self._dirty_tiles:
+            tile = self.tiles.get(coords)
+            item = self._tile_item_ids.get(coords)
+
+            if tile is None or tile.sprite not in self.tile_images:
+                if item is not None:
+                    self.map_canvas.delete(item)
+                    del self._tile_item_ids[coords]
+            elif item is not None:
+                self.map_canvas.itemconfigure(item, image=self.tile_images[tile.sprite])
+            else:
+                self._create_tile_item(coords[0], coords[1], tile.sprite)
+                created = True
+
+        self._dirty_tiles.clear()
+
+        # Keep mode overlays above tiles drawn after them
+        if created:
+            self.map_canvas.tag_raise("overlay")
 
     def _save_map(self) -> None:
         """Save the current map to a file."""
@@ -566,27 +971,27 @@ class Mapper:
         path = filedialog.asksaveasfilename(
             title="Save Map",
             defaultextension=".map",
-            filetypes=[("Map files", "*.map"), ("All files", "*.*")]
+            filetypes=_MAP_FILETYPES
         )
         if not path:
             return
 
         try:
-            save_map(
+            save = save_map_bin if path.endswith(BINARY_MAP_EXTENSION) else save_map
+            save(
                 path,
                 self.tiles,
                 self.spawns,
                 self.characters,
                 self.atlas_path,
                 self.map_name,
-                self.clear_color
+                self.clear_color,
+                bounds=self._bbox,
+                examine_coords=self.examine_coords
             )
 
             # Calculate dimensions for status message
-            min_x = min(x for x, y in self.tiles.keys())
-            max_x = max(x for x, y in self.tiles.keys())
-            min_y = min(y for x, y in self.tiles.keys())
-            max_y = max(y for x, y in self.tiles.keys())
+            min_x, min_y, max_x, max_y = self._bbox
             width = max_x - min_x + 1
             height = max_y - min_y + 1
 
@@ -14,12 +14,18 @@ File format:
     --- <future sections>
     ...
 
+Rows within a section may appear in any order: every row is keyed by its
+(x, y) coordinates when loaded.
+
+A binary variant (save_map_bin/load_map_bin, see "Binary Format" below)
+stores the tile data as packed arrays and keeps everything else as text.
+
 To add a new tile attribute:
 1. Add field to Tile dataclass in tile.py
 2. Add _parse_<attr>_line() function
 3. Add section handling in _parse_map_file()
 4. Add _write_<attr>_section() function
-5. Call _write_<attr>_section() in save_map()
+5. Call _write_<attr>_section() in save_map() and save_map_bin()
 
 To add a new entity type (like spawns):
 1. Create dataclass in its own module
@@ -27,20 +33,46 @@ To add a new entity type (like spawns):
 3. Add section handling in _parse_map_file()
 4. Add _write_<entity>_section() function
 5. Update MapData to include the new collection
-6. Update save_map() signature and call the write function
+6. Update save_map() and save_map_bin() signatures and call the write function
 """
 
 from __future__ import annotations
 
+import codecs
+import io
+import mmap
 import os
-from typing import TYPE_CHECKING
+import re
+import struct
+import sys
+from array import array
+from itertools import chain
+from typing import TYPE_CHECKING, TypeVar
 
 from mapper.character import Character
+from mapper.constants import BLANK_OR_COMMENT_START
 from mapper.monsterspawn import MonsterSpawn
 from mapper.tile import Tile
 
 if TYPE_CHECKING:
-    from typing import TextIO
+    from typing import Collection, Container, Iterable, TextIO
+
+_T = TypeVar("_T")
+
+# A well-formed tile line: x	y	sprite	blocked
+_TILE_LINE_RE = re.compile(rb"^(-?\d+)\t(-?\d+)\t(-?\d+)\t(-?\d+)\r?$", re.MULTILINE)
+
+# Warnings printed by load_map before the rest are summarized as a count
+_MAX_REPORTED_WARNINGS = 20
+
+# BLANK_OR_COMMENT_START as bytes, for the byte-level _section_rows
+_BLANK_OR_COMMENT_START = BLANK_OR_COMMENT_START.encode("ascii")
+
+# A section delimiter line: --- [name]
+_SECTION_RE = re.compile(rb"^[ \t]*---(.*)$", re.MULTILINE)
+
+# A line break that is a lone \r rather than part of \r\n
+_BARE_CR_RE = re.compile(rb"\r(?!\n)")
 
 
 class MapData:
@@ -84,48 +116,146 @@ def load_map(path: str, valid_sprite_indices: set[int]) -> MapData:
         IOError: If file cannot be read.
         ValueError: If file format is invalid.
     """
-    with open(path, "r") as f:
-        return _parse_map_file(f, valid_sprite_indices)
-
+    valid_sprites = _sprite_index_lookup(valid_sprite_indices)
 
-def _parse_map_file(f: TextIO, valid_sprite_indices: set[int]) -> MapData:
-    """Parse map file contents."""
     data = MapData()
+    warnings: list[str] = []
+
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return data
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Skip a UTF-8 byte order mark if an editor added one
+            start = len(codecs.BOM_UTF8) if mm[:3] == codecs.BOM_UTF8 else 0
+            _parse_map_file(mm, start, valid_sprites, data, warnings)
+
+    _report_warnings(warnings)
+    return data
+
+
+def _report_warnings(warnings: list[str]) -> None:
+    """Print parse warnings in one go, truncated for badly broken files."""
+    if not warnings:
+        return
+
+    shown = warnings[:_MAX_REPORTED_WARNINGS]
+    hidden = len(warnings) - len(shown)
+    if hidden:
+        shown.append(f"... and {hidden} more warning(s)")
+
+    print("\n".join(shown))
+
+
+def _sprite_index_lookup(valid_sprite_indices: set[int]) -> Container[int]:
+    """
+    Return the cheapest container for sprite index membership tests.
+
+    Atlases always index their sprites 0..N-1, in which case a range is
+    returned: its membership test is two integer compares instead of a hash
+    lookup. Any other set is returned unchanged.
+    """
+    count = len(valid_sprite_indices)
+    if count and min(valid_sprite_indices) == 0 and max(valid_sprite_indices) == count - 1:
+        return range(count)
+    return valid_sprite_indices
+
+
+def _parse_map_file(
+    buf: bytes | mmap.mmap,
+    start: int,
+    valid_sprite_indices: Container[int],
+    data: MapData,
+    warnings: list[str]
+) -> None:
+    """
+    Parse map file contents into data.
+
+    Sections stay raw bytes: the tile section is parsed directly from its
+    block, and only the other sections are split into lines and decoded.
+    Problems with individual lines are appended to warnings rather than
+    printed, keeping console I/O out of the parse loops.
+    """
+    # The splitters below break lines only at \n, and the line parsers drop
+    # the \r of \r\n. Files with lone \r line breaks (old Mac style, or
+    # mixed) are normalized first, as text-mode universal newlines would.
+    first_cr = buf.find(b"\r", start)
+    if first_cr != -1 and _BARE_CR_RE.search(buf, first_cr):
+        buf = buf[start:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        start = 0
+
+    for section, line_num, block in _split_sections(buf, start):
+        # Dispatch based on section
+        if section == "tiles":
+            _parse_tile_section(block, line_num, valid_sprite_indices, data.tiles, warnings)
+        elif section is None:
+            for _, line in _section_rows(block, line_num):
+                _parse_header_line(line.decode("utf-8").strip(), data.header)
+        elif section == "examine":
+            for line_num, line in _section_rows(block, line_num):
+                _parse_examine_line(line.decode("utf-8"), line_num, data.tiles, warnings)
+        elif section == "spawns":
+            for line_num, line in _section_rows(block, line_num):
+                _parse_spawn_line(line.decode("utf-8"), line_num, data.spawns, warnings)
+        elif section == "characters":
+            for line_num, line in _section_rows(block, line_num):
+                _parse_character_line(line.decode("utf-8"), line_num, data.characters, warnings)
+        # Unknown sections are silently skipped (forward compatibility)
+
+
+def _split_sections(buf: bytes | mmap.mmap, start: int) -> list[tuple[str | None, int, bytes]]:
+    """
+    Split map file contents into sections at the --- delimiter lines.
+
+    Returns:
+        (section, line_num, block) triples in file order, where section is
+        None for the header, "tiles" for the main block, or the named
+        section, and block is the raw bytes between delimiters. The first
+        line of block (up to its first newline) is line line_num.
+    """
+    sections: list[tuple[str | None, int, bytes]] = []
     current_section: str | None = None  # None = header, "tiles" = main, or section name
+    line_num = 1
+    pos = start
+
+    for match in _SECTION_RE.finditer(buf, start):
+        block = buf[pos:match.start()]
+        sections.append((current_section, line_num, block))
+        line_num += block.count(b"\n")
+        pos = match.end()
 
-    for line_num, line in enumerate(f, 1):
-        line = line.rstrip("\n\r")
-
-        # Skip empty lines and comments
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Check for section delimiter
-        if stripped.startswith("---"):
-            if current_section is None:
-                # End of header, start of tiles
-                current_section = "tiles"
-            else:
-                # New named section
-                section_name = stripped[3:].strip()
-                current_section = section_name if section_name else "tiles"
-            continue
-
-        # Dispatch based on current section
         if current_section is None:
-            _parse_header_line(stripped, data.header)
-        elif current_section == "tiles":
-            _parse_tile_line(line, line_num, valid_sprite_indices, data.tiles)
-        elif current_section == "examine":
-            _parse_examine_line(line, line_num, data.tiles)
-        elif current_section == "spawns":
-            _parse_spawn_line(line, line_num, data.spawns)
-        elif current_section == "characters":
-            _parse_character_line(line, line_num, data.characters)
-        # Unknown sections are silently skipped (forward compatibility)
+            # End of header, start of tiles
+            current_section = "tiles"
+        else:
+            # New named section
+            section_name = match.group(1).strip().decode("utf-8")
+            current_section = section_name if section_name else "tiles"
 
-    return data
+    sections.append((current_section, line_num, buf[pos:]))
+    return sections
+
+
+def _section_rows(block: bytes, line_num: int) -> list[tuple[int, bytes]]:
+    """
+    Split a section block into (line_num, line) pairs, dropping empty lines
+    and comments.
+    """
+    rows = []
+
+    for line_num, line in enumerate(block.split(b"\n"), line_num):
+        # Skip empty lines and comments. Data lines start with a visible
+        # character, so only lines that could be either pay for strip();
+        # the slice is b"" for an empty line, which the test also catches
+        if line[:1] in _BLANK_OR_COMMENT_START:
+            stripped = line.strip()
+            if not stripped or stripped.startswith(b"#"):
+                continue
+
+        rows.append((line_num, line.rstrip(b"\r")))
+
+    return rows
 
 
 def _parse_header_line(line: str, header: dict[str, str]) -> None:
@@ -138,40 +268,108 @@ def _parse_header_line(line: str, header: dict[str, str]) -> None:
 def _parse_tile_line(
     line: str,
     line_num: int,
-    valid_sprite_indices: set[int],
-    tiles: dict[tuple[int, int], Tile]
+    valid_sprite_indices: Container[int],
+    tiles: dict[tuple[int, int], Tile],
+    warnings: list[str]
 ) -> None:
     """
     Parse a tile line and add to tiles dict.
 
     Format: x	y	sprite	blocked (tab-delimited)
     """
-    parts = line.split("\t")
+    # Extra trailing fields are ignored, so there is no need to split them
+    parts = line.split("\t", 4)
 
     if len(parts) < 4:
-        print(f"Warning line {line_num}: insufficient fields")
+        warnings.append(f"Warning line {line_num}: insufficient fields")
         return
 
     try:
         x = int(parts[0])
         y = int(parts[1])
         sprite = int(parts[2])
-        blocked = bool(int(parts[3]))
+        blocked = int(parts[3]) != 0
 
         if sprite not in valid_sprite_indices:
-            print(f"Warning line {line_num}: sprite index {sprite} not in loaded atlas")
+            warnings.append(f"Warning line {line_num}: sprite index {sprite} not in loaded atlas")
             return
 
-        tiles[(x, y)] = Tile(sprite=sprite, blocked=blocked)
+        tiles[(x, y)] = Tile(sprite, blocked)
 
     except ValueError as e:
-        print(f"Warning line {line_num}: failed to parse tile: {e}")
+        warnings.append(f"Warning line {line_num}: failed to parse tile: {e}")
+
+
+def _parse_tile_section(
+    block: bytes,
+    line_num: int,
+    valid_sprite_indices: Container[int],
+    tiles: dict[tuple[int, int], Tile],
+    warnings: list[str]
+) -> None:
+    """
+    Parse a tile section block and add its tiles to tiles dict.
+
+    A block made only of well-formed lines is matched in a single regex pass
+    and converted with map(int, ...), keeping the per-line work out of the
+    interpreter, and tiles with unknown sprites are reported in one warning.
+    Anything else (comments, blank lines, malformed rows) falls back to
+    _parse_tile_line so malformed lines get their usual warnings.
+    """
+    body = block.strip()
+    matches = _TILE_LINE_RE.findall(body)
+    if not body or len(matches) != body.count(b"\n") + 1:
+        for line_num, line in _section_rows(block, line_num):
+            _parse_tile_line(line.decode("utf-8", "replace"), line_num, valid_sprite_indices, tiles, warnings)
+        return
+
+    # Line number of the first row, past any leading blank lines
+    line_num += block.count(b"\n", 0, block.index(body[:1]))
+
+    values = iter(map(int, chain.from_iterable(matches)))
+    _add_tiles(
+        zip(range(line_num, line_num + len(matches)), values, values, values, values),
+        valid_sprite_indices, tiles, warnings, "line"
+    )
+
+
+def _add_tiles(
+    records: Iterable[tuple[int, int, int, int, int]],
+    valid_sprite_indices: Container[int],
+    tiles: dict[tuple[int, int], Tile],
+    warnings: list[str],
+    position: str
+) -> None:
+    """
+    Add (position, x, y, sprite, blocked) records to tiles dict.
+
+    Records whose sprite is not in the atlas are skipped and reported in a
+    single warning naming the first one's position (e.g. "line" number).
+    """
+    # Hot loop: bind globals to locals and pass Tile fields positionally
+    _Tile = Tile
+    valid = valid_sprite_indices
+    skipped: list[int] = []
+
+    for pos, x, y, sprite, blocked in records:
+        if sprite in valid:
+            tiles[x, y] = _Tile(sprite, blocked != 0)
+        else:
+            skipped.append(pos)
+
+    # A map made for another atlas can miss on every row, so report once
+    if skipped:
+        warnings.append(
+            f"Warning: skipped {len(skipped)} tile(s) with sprite index not in "
+            f"loaded atlas (first at {position} {skipped[0]})"
+        )
 
 
 def _parse_examine_line(
     line: str,
     line_num: int,
-    tiles: dict[tuple[int, int], Tile]
+    tiles: dict[tuple[int, int], Tile],
+    warnings: list[str]
 ) -> None:
     """
     Parse an examine text line and apply to existing tile.
@@ -181,7 +379,7 @@ def _parse_examine_line(
     parts = line.split("\t", 2)  # Split into at most 3 parts
 
     if len(parts) < 3:
-        print(f"Warning line {line_num}: insufficient fields in examine section")
+        warnings.append(f"Warning line {line_num}: insufficient fields in examine section")
         return
 
     try:
@@ -193,16 +391,17 @@ def _parse_examine_line(
         if coords in tiles:
             tiles[coords].examine_text = examine_text if examine_text else None
         else:
-            print(f"Warning line {line_num}: examine text for non-existent tile ({x}, {y})")
+            warnings.append(f"Warning line {line_num}: examine text for non-existent tile ({x}, {y})")
 
     except ValueError as e:
-        print(f"Warning line {line_num}: failed to parse examine line: {e}")
+        warnings.append(f"Warning line {line_num}: failed to parse examine line: {e}")
 
 
 def _parse_spawn_line(
     line: str,
     line_num: int,
-    spawns: dict[tuple[int, int], MonsterSpawn]
+    spawns: dict[tuple[int, int], MonsterSpawn],
+    warnings: list[str]
 ) -> None:
     """
     Parse a spawn line and add to spawns dict.
@@ -212,7 +411,7 @@ def _parse_spawn_line(
     parts = line.split("\t")
 
     if len(parts) < 4:
-        print(f"Warning line {line_num}: insufficient fields in spawns section")
+        warnings.append(f"Warning line {line_num}: insufficient fields in spawns section")
         return
 
     try:
@@ -222,19 +421,20 @@ def _parse_spawn_line(
         respawn_ticks = int(parts[3])
 
         if not name:
-            print(f"Warning line {line_num}: empty spawn name")
+            warnings.append(f"Warning line {line_num}: empty spawn name")
             return
 
         spawns[(x, y)] = MonsterSpawn(name=name, respawn_ticks=respawn_ticks)
 
     except ValueError as e:
-        print(f"Warning line {line_num}: failed to parse spawn line: {e}")
+        warnings.append(f"Warning line {line_num}: failed to parse spawn line: {e}")
 
 
 def _parse_character_line(
     line: str,
     line_num: int,
-    characters: dict[tuple[int, int], Character]
+    characters: dict[tuple[int, int], Character],
+    warnings: list[str]
 ) -> None:
     """
     Parse a character line and add to characters dict.
@@ -244,7 +444,7 @@ def _parse_character_line(
     parts = line.split("\t")
 
     if len(parts) < 3:
-        print(f"Warning line {line_num}: insufficient fields in characters section")
+        warnings.append(f"Warning line {line_num}: insufficient fields in characters section")
         return
 
     try:
@@ -253,13 +453,13 @@ def _parse_character_line(
         name = parts[2]
 
         if not name:
-            print(f"Warning line {line_num}: empty character name")
+            warnings.append(f"Warning line {line_num}: empty character name")
             return
 
         characters[(x, y)] = Character(name=name)
 
     except ValueError as e:
-        print(f"Warning line {line_num}: failed to parse character line: {e}")
+        warnings.append(f"Warning line {line_num}: failed to parse character line: {e}")
 
 
 # =============================================================================
@@ -273,7 +473,10 @@ def save_map(
     characters: dict[tuple[int, int], Character],
     atlas_path: str | None,
     map_name: str = "Untitled",
-    clear_color: str = "#000000"
+    clear_color: str = "#000000",
+    bounds: tuple[int, int, int, int] | None = None,
+    examine_coords: Collection[tuple[int, int]] | None = None,
+    sort: bool = False
 ) -> None:
     """
     Save a map to disk.
@@ -286,94 +489,307 @@ def save_map(
         atlas_path: Path to the atlas file (for header metadata).
         map_name: Name of the map.
         clear_color: Background/clear color as hex string (e.g. "#000000").
+        bounds: Precomputed (min_x, min_y, max_x, max_y) of tiles, if the
+            caller already tracks them. Computed from tiles when omitted.
+        examine_coords: Coordinates of the tiles with examine text, if the
+            caller already tracks them. Found by scanning tiles when omitted.
+        sort: Write rows sorted by (x, y) rather than in dict order. The
+            loader does not care; sorting only makes saves diff-friendly.
 
     Raises:
         IOError: If file cannot be written.
     """
+    header = _format_header(tiles, atlas_path, map_name, clear_color, bounds)
+
+    with open(path, "w", buffering=1 << 20, newline="\n", encoding="utf-8") as f:
+        # Write header
+        f.write(header + "---\n")
+
+        # Write tiles as one preformatted block (x	y	sprite	blocked)
+        items = _ordered_items(tiles, sort)
+        f.write("\n".join([
+            f"{x}\t{y}\t{tile.sprite}\t{1 if tile.blocked else 0}"
+            for (x, y), tile in items
+        ]))
+        f.write("\n")
+
+        # Write examine section (only if any tiles have examine text)
+        _write_examine_section(f, _examine_items(items, tiles, examine_coords, sort))
+
+        # Write spawns section (only if any spawns exist)
+        _write_spawns_section(f, spawns, sort)
+
+        # Write characters section (only if any characters exist)
+        _write_characters_section(f, characters, sort)
+
+
+def _format_header(
+    tiles: dict[tuple[int, int], Tile],
+    atlas_path: str | None,
+    map_name: str,
+    clear_color: str,
+    bounds: tuple[int, int, int, int] | None
+) -> str:
+    """Format the header lines (without the closing ---) for a non-empty map."""
     if not tiles:
         raise ValueError("Cannot save empty map")
 
     # Calculate bounds
-    min_x = min(x for x, y in tiles.keys())
-    max_x = max(x for x, y in tiles.keys())
-    min_y = min(y for x, y in tiles.keys())
-    max_y = max(y for x, y in tiles.keys())
+    if bounds is None:
+        bounds = tile_bounds(tiles)
+    min_x, min_y, max_x, max_y = bounds
 
     width = max_x - min_x + 1
     height = max_y - min_y + 1
     atlas_name = os.path.basename(atlas_path) if atlas_path else "unknown"
 
-    with open(path, "w") as f:
-        # Write header
-        f.write(f"name:{map_name}\n")
-        f.write(f"width:{width}\n")
-        f.write(f"height:{height}\n")
-        f.write(f"origin:{min_x},{min_y}\n")
-        f.write(f"tileset:{atlas_name}\n")
-        f.write(f"clear_color:{clear_color}\n")
-        f.write("---\n")
-
-        # Write tiles
-        for (x, y), tile in sorted(tiles.items()):
-            f.write(_serialize_tile(x, y, tile))
-            f.write("\n")
+    return (
+        f"name:{map_name}\n"
+        f"width:{width}\n"
+        f"height:{height}\n"
+        f"origin:{min_x},{min_y}\n"
+        f"tileset:{atlas_name}\n"
+        f"clear_color:{clear_color}\n"
+    )
 
-        # Write examine section (only if any tiles have examine text)
-        _write_examine_section(f, tiles)
 
-        # Write spawns section (only if any spawns exist)
-        _write_spawns_section(f, spawns)
+def tile_bounds(tiles: dict[tuple[int, int], Tile]) -> tuple[int, int, int, int]:
+    """Return (min_x, min_y, max_x, max_y) of a non-empty tiles dict in one pass."""
+    # Measured faster than C-level reductions such as min/max over zip(*tiles):
+    # splitting the keys into per-axis sequences costs more than these compares
+    min_x, min_y = max_x, max_y = next(iter(tiles))
 
-        # Write characters section (only if any characters exist)
-        _write_characters_section(f, characters)
+    for x, y in tiles:
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
 
+    return min_x, min_y, max_x, max_y
 
-def _serialize_tile(x: int, y: int, tile: Tile) -> str:
+
+def _coord_sort_key(coords: tuple[int, int]) -> int:
+    """Pack (x, y) into one int that orders the same as the tuple."""
+    x, y = coords
+    return (x << 32) + y
+
+
+def _sorted_coords(coords: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
     """
-    Serialize a tile's core attributes.
+    Return coordinates sorted by x, then y.
 
-    Format: x	y	sprite	blocked (tab-delimited)
+    Sorting on a single packed integer lets the sort compare plain ints
+    instead of recursing into tuples, which is roughly twice as fast on
+    large maps. Assumes coordinates fit in 32 bits.
     """
-    blocked_flag = 1 if tile.blocked else 0
-    return f"{x}\t{y}\t{tile.sprite}\t{blocked_flag}"
+    return sorted(coords, key=_coord_sort_key)
+
 
+def _ordered_items(
+    entries: dict[tuple[int, int], _T],
+    sort: bool
+) -> list[tuple[tuple[int, int], _T]]:
+    """Return (coords, value) pairs in write order: sorted if requested, else dict order."""
+    if sort:
+        return [(coords, entries[coords]) for coords in _sorted_coords(entries)]
+    return list(entries.items())
+
+
+def _examine_items(
+    tile_items: list[tuple[tuple[int, int], Tile]],
+    tiles: dict[tuple[int, int], Tile],
+    examine_coords: Collection[tuple[int, int]] | None,
+    sort: bool
+) -> list[tuple[tuple[int, int], Tile]]:
+    """
+    Return the (coords, tile) pairs to write in the examine section.
 
-def _write_examine_section(f: TextIO, tiles: dict[tuple[int, int], Tile]) -> None:
+    With tracked examine_coords only those tiles are visited. Otherwise
+    tile_items, the list already written as the tile section, is filtered,
+    so examine rows come out in the same order without a re-sort.
+    Tracked coordinates with no tile are skipped: the set belongs to the
+    caller and may be stale.
+    """
+    if examine_coords is None:
+        return [(coords, tile) for coords, tile in tile_items if tile.examine_text is not None]
+
+    order = _sorted_coords(examine_coords) if sort else examine_coords
+    items = []
+    for coords in order:
+        tile = tiles.get(coords)
+        if tile is not None:
+            items.append((coords, tile))
+    return items
+
+
+def _write_examine_section(
+    f: TextIO,
+    examine_items: list[tuple[tuple[int, int], Tile]]
+) -> None:
     """Write the examine text section if any tiles have examine text."""
-    examine_tiles = [
-        (coords, tile) for coords, tile in tiles.items()
+    examine_rows = [
+        f"{x}\t{y}\t{tile.examine_text}\n"
+        for (x, y), tile in examine_items
         if tile.examine_text is not None
     ]
 
-    if not examine_tiles:
+    if not examine_rows:
         return
 
-    f.write("--- examine\n")
-    for (x, y), tile in sorted(examine_tiles):
-        f.write(f"{x}\t{y}\t{tile.examine_text}\n")
+    f.write("--- examine\n" + "".join(examine_rows))
 
 
 def _write_spawns_section(
     f: TextIO,
-    spawns: dict[tuple[int, int], MonsterSpawn]
+    spawns: dict[tuple[int, int], MonsterSpawn],
+    sort: bool
 ) -> None:
     """Write the spawns section if any spawns exist."""
     if not spawns:
         return
 
-    f.write("--- spawns\n")
-    for (x, y), spawn in sorted(spawns.items()):
-        f.write(f"{x}\t{y}\t{spawn.name}\t{spawn.respawn_ticks}\n")
+    f.write("--- spawns\n" + "".join([
+        f"{x}\t{y}\t{spawn.name}\t{spawn.respawn_ticks}\n"
+        for (x, y), spawn in _ordered_items(spawns, sort)
+    ]))
 
 
 def _write_characters_section(
     f: TextIO,
-    characters: dict[tuple[int, int], Character]
+    characters: dict[tuple[int, int], Character],
+    sort: bool
 ) -> None:
     """Write the characters section if any characters exist."""
     if not characters:
         return
 
-    f.write("--- characters\n")
-    for (x, y), character in sorted(characters.items()):
-        f.write(f"{x}\t{y}\t{character.name}\n")
\ No newline at end of file
+    f.write("--- characters\n" + "".join([
+        f"{x}\t{y}\t{character.name}\n"
+        for (x, y), character in _ordered_items(characters, sort)
+    ]))
+
+
+# =============================================================================
+# Binary Format
+# =============================================================================
+#
+# An alternative to the text format for large maps, where parsing and
+# formatting numbers dominates load and save time. Layout (little-endian):
+#
+#     magic "SCMB", version (u16), tile count N (u32)
+#     x (i32 * N), y (i32 * N), sprite (u16 * N), blocked (u8 * N)
+#     the rest of the map as UTF-8 text: header, ---, then the examine,
+#     spawns and characters sections, exactly as in a .map file
+#
+# Tile columns are read and written as whole arrays, so the tile data never
+# goes through int() or string formatting.
+
+BINARY_MAP_EXTENSION = ".mapb"
+
+_BIN_MAGIC = b"SCMB"
+_BIN_VERSION = 1
+_BIN_HEADER = struct.Struct("<4sHI")  # magic, version, tile count
+_BIN_COLUMNS = ("i", "i", "H", "B")  # x, y, sprite, blocked
+
+
+def save_map_bin(
+    path: str,
+    tiles: dict[tuple[int, int], Tile],
+    spawns: dict[tuple[int, int], MonsterSpawn],
+    characters: dict[tuple[int, int], Character],
+    atlas_path: str | None,
+    map_name: str = "Untitled",
+    clear_color: str = "#000000",
+    bounds: tuple[int, int, int, int] | None = None,
+    examine_coords: Collection[tuple[int, int]] | None = None
+) -> None:
+    """
+    Save a map to disk in the binary format.
+
+    Takes the same arguments as save_map, except that rows are always
+    written in dict order. Sprite indices must fit in 16 bits.
+
+    Raises:
+        IOError: If file cannot be written.
+    """
+    header = _format_header(tiles, atlas_path, map_name, clear_color, bounds)
+
+    items = list(tiles.items())
+    columns = (
+        array("i", [x for (x, _), _ in items]),
+        array("i", [y for (_, y), _ in items]),
+        array("H", [tile.sprite for _, tile in items]),
+        array("B", [tile.blocked for _, tile in items])
+    )
+    if sys.byteorder == "big":
+        for column in columns:
+            column.byteswap()
+
+    # Everything but the tiles stays in the text format
+    text = io.StringIO()
+    text.write(header + "---\n")
+    _write_examine_section(text, _examine_items(items, tiles, examine_coords, False))
+    _write_spawns_section(text, spawns, False)
+    _write_characters_section(text, characters, False)
+
+    with open(path, "wb") as f:
+        f.write(_BIN_HEADER.pack(_BIN_MAGIC, _BIN_VERSION, len(items)))
+        for column in columns:
+            column.tofile(f)
+        f.write(text.getvalue().encode("utf-8"))
+
+
+def load_map_bin(path: str, valid_sprite_indices: set[int]) -> MapData:
+    """
+    Load a map file saved by save_map_bin.
+
+    Args:
+        path: Path to the binary map file.
+        valid_sprite_indices: Set of valid sprite indices from loaded atlas.
+
+    Returns:
+        MapData containing header info, tiles, spawns, and characters.
+
+    Raises:
+        IOError: If file cannot be read.
+        ValueError: If file is not a binary map or is truncated.
+    """
+    with open(path, "rb") as f:
+        buf = f.read()
+
+    if len(buf) < _BIN_HEADER.size:
+        raise ValueError("Not a binary map file")
+    magic, version, count = _BIN_HEADER.unpack_from(buf)
+    if magic != _BIN_MAGIC:
+        raise ValueError("Not a binary map file")
+    if version != _BIN_VERSION:
+        raise ValueError(f"Unsupported binary map version {version}")
+
+    view = memoryview(buf)
+    pos = _BIN_HEADER.size
+    columns = []
+    for typecode in _BIN_COLUMNS:
+        column = array(typecode)
+        end = pos + count * column.itemsize
+        if end > len(buf):
+            raise ValueError("Truncated binary map file")
+        column.frombytes(view[pos:end])
+        if sys.byteorder == "big":
+            column.byteswap()
+        columns.append(column)
+        pos = end
+
+    data = MapData()
+    warnings: list[str] = []
+    valid_sprites = _sprite_index_lookup(valid_sprite_indices)
+
+    _add_tiles(zip(range(count), *columns), valid_sprites, data.tiles, warnings, "record")
+    _parse_map_file(buf, pos, valid_sprites, data, warnings)
+
+    _report_warnings(warnings)
+    return data
+
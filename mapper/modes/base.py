@@ -41,11 +41,17 @@ class EditorMode(ABC):
         return ""
 
     def on_activate(self) -> None:
-        """Called when switching to this mode."""
+        """Called when switching to this mode, and again after a map is loaded."""
         pass
 
     def on_deactivate(self) -> None:
-        """Called when leaving this mode."""
+        """
+        Called when leaving this mode, and before a map is loaded.
+
+        The panel from build_panel is hidden, not destroyed, and shown again
+        on the next activation; reset any selection it displays here so it
+        comes back as a freshly built panel would.
+        """
         pass
 
     def on_map_click(self, world_x: int, world_y: int, event: tk.Event) -> None:
@@ -61,13 +67,22 @@ class EditorMode(ABC):
         pass
 
     def render_overlay(self) -> None:
-        """Draw mode-specific visuals on map canvas."""
+        """
+        Draw mode-specific visuals on map canvas.
+
+        The editor deletes every item tagged "overlay" just before calling
+        this, so ids of overlay items kept from an earlier call are stale and
+        should be forgotten here.
+        """
         pass
 
     def build_panel(self, parent: tk.Frame) -> tk.Frame | None:
         """
         Build and return a widget for the left panel.
 
+        Called once, the first time the mode is shown (and again after an
+        atlas change); the editor keeps the panel between activations.
+
         Args:
             parent: Parent frame to contain the panel.
 
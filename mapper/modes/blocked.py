@@ -8,11 +8,22 @@ import tkinter as tk
 
 from mapper.constants import DISPLAY_SIZE
 from mapper.modes.base import EditorMode
+from mapper.overlay import tile_transform
+
+# Indicator circle, as an inset from the tile's top-left corner
+_RADIUS = DISPLAY_SIZE // 4
+_INSET = DISPLAY_SIZE // 2 - _RADIUS
 
 
 class BlockedMode(EditorMode):
     """Mode for marking tiles as blocked (impassable)."""
 
+    def __init__(self, editor) -> None:
+        super().__init__(editor)
+        # Indicator item per tile drawn since the last render_overlay; items
+        # for tiles toggled back to passable are hidden, not deleted
+        self._items: dict[tuple[int, int], int] = {}
+
     def get_name(self) -> str:
         return "Blocked"
 
@@ -20,8 +31,7 @@ class BlockedMode(EditorMode):
         return "LMB: Toggle blocked | Ctrl+LMB: Pan | Hotkeys: [P]aint [B]locked"
 
     def on_activate(self) -> None:
-        blocked_count = sum(1 for t in self.editor.tiles.values() if t.blocked)
-        self.editor.update_status(f"{blocked_count} blocked tiles")
+        self.editor.update_status(f"{self.editor.blocked_count} blocked tiles")
 
     def on_map_click(self, world_x: int, world_y: int, event: tk.Event) -> None:
         self._toggle_blocked(world_x, world_y)
@@ -39,55 +49,54 @@ class BlockedMode(EditorMode):
 
         # Toggle blocked state
         tile.blocked = not tile.blocked
+        editor.blocked_count += 1 if tile.blocked else -1
         state = "blocked" if tile.blocked else "passable"
 
         # Update just this tile's overlay
         self._update_tile_overlay(tile_x, tile_y)
 
-        blocked_count = sum(1 for t in editor.tiles.values() if t.blocked)
         editor.update_status(
-            f"Tile ({tile_x}, {tile_y}) now {state} | {blocked_count} blocked total"
+            f"Tile ({tile_x}, {tile_y}) now {state} | {editor.blocked_count} blocked total"
         )
 
     def _update_tile_overlay(self, tile_x: int, tile_y: int) -> None:
         """Update the overlay for a single tile."""
         editor = self.editor
-        tag = f"blocked_{tile_x}_{tile_y}"
-
-        # Remove existing overlay for this tile
-        editor.map_canvas.delete(tag)
-
-        # Draw new overlay if blocked
-        tile = editor.tiles.get((tile_x, tile_y))
-        if tile and tile.blocked:
-            self._draw_blocked_indicator(tile_x, tile_y, tag)
-
-    def _draw_blocked_indicator(self, tile_x: int, tile_y: int, tag: str) -> None:
-        """Draw a red circle indicator for a blocked tile."""
-        editor = self.editor
-
-        px = editor.world_to_canvas_x(tile_x)
-        py = editor.world_to_canvas_y(tile_y)
-
-        center_x = px + DISPLAY_SIZE // 2
-        center_y = py + DISPLAY_SIZE // 2
-        radius = DISPLAY_SIZE // 4
+        coords = (tile_x, tile_y)
 
-        editor.map_canvas.create_oval(
-            center_x - radius, center_y - radius,
-            center_x + radius, center_y + radius,
+        tile = editor.tiles.get(coords)
+        blocked = tile is not None and tile.blocked
+
+        # Show or hide an existing indicator rather than recreating it
+        item = self._items.get(coords)
+        if item is not None:
+            editor.map_canvas.itemconfigure(item, state=tk.NORMAL if blocked else tk.HIDDEN)
+        elif blocked:
+            scale, offset = tile_transform(_INSET)
+            self._items[coords] = self._draw_blocked_indicator(
+                tile_x * scale + offset, tile_y * scale + offset
+            )
+
+    def _draw_blocked_indicator(self, left: int, top: int) -> int:
+        """Draw a red circle indicator with its bounding box at canvas (left, top)."""
+        return self.editor.map_canvas.create_oval(
+            left, top,
+            left + 2 * _RADIUS, top + 2 * _RADIUS,
             fill="#cc0000",
             outline="#ff0000",
             width=2,
-            tags=("overlay", tag)
+            tags="overlay"
         )
 
     def render_overlay(self) -> None:
         """Draw blocked indicators on all blocked tiles."""
+        items = self._items = {}
+        draw = self._draw_blocked_indicator
+        scale, offset = tile_transform(_INSET)
+
         for (tile_x, tile_y), tile in self.editor.tiles.items():
             if tile.blocked:
-                tag = f"blocked_{tile_x}_{tile_y}"
-                self._draw_blocked_indicator(tile_x, tile_y, tag)
+                items[tile_x, tile_y] = draw(tile_x * scale + offset, tile_y * scale + offset)
 
     def build_panel(self, parent: tk.Frame) -> tk.Frame:
         """Build a simple info panel."""
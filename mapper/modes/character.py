@@ -10,6 +10,11 @@ from tkinter import messagebox
 from mapper.character import Character
 from mapper.constants import DISPLAY_SIZE
 from mapper.modes.base import EditorMode
+from mapper.overlay import tile_transform
+
+# Indicator circle, relative to the tile's top-left corner
+_RADIUS = DISPLAY_SIZE // 3
+_CENTER = DISPLAY_SIZE // 2
 
 
 class CharacterMode(EditorMode):
@@ -19,6 +24,9 @@ class CharacterMode(EditorMode):
         super().__init__(editor)
         self._selected_coords: tuple[int, int] | None = None
 
+        # (circle, label) items per character drawn since the last render_overlay
+        self._items: dict[tuple[int, int], tuple[int, int]] = {}
+
         # Panel widgets
         self._coords_var: tk.StringVar | None = None
         self._name_var: tk.StringVar | None = None
@@ -39,6 +47,8 @@ class CharacterMode(EditorMode):
 
     def on_deactivate(self) -> None:
         self._selected_coords = None
+        self._clear_fields()
+        self._update_button_states()
 
     def on_map_click(self, world_x: int, world_y: int, event: tk.Event) -> None:
         """Select a tile for character editing."""
@@ -115,7 +125,7 @@ class CharacterMode(EditorMode):
         self.editor.characters[self._selected_coords] = Character(name=name)
 
         self._update_button_states()
-        self._refresh_overlay()
+        self._refresh_character(self._selected_coords)
 
         char_count = len(self.editor.characters)
         self.editor.update_status(
@@ -135,17 +145,32 @@ class CharacterMode(EditorMode):
 
         self._load_character_data()  # Refresh fields
         self._update_button_states()
-        self._refresh_overlay()
+        self._refresh_character(self._selected_coords)
 
         char_count = len(self.editor.characters)
         self.editor.update_status(
             f"Deleted character '{name}' | {char_count} remaining"
         )
 
-    def _refresh_overlay(self) -> None:
-        """Refresh the character overlay."""
-        self.editor.map_canvas.delete("overlay")
-        self.render_overlay()
+    def _refresh_character(self, coords: tuple[int, int]) -> None:
+        """Update the overlay for one character after it was saved or deleted."""
+        editor = self.editor
+        character = editor.characters.get(coords)
+        items = self._items.get(coords)
+
+        if items is not None:
+            if character is not None:
+                # Only the name can change; relabel the existing item
+                editor.map_canvas.itemconfigure(items[1], text=character.name)
+                return
+            editor.map_canvas.delete(*items)
+            del self._items[coords]
+        elif character is not None:
+            tile_x, tile_y = coords
+            scale, center = tile_transform(_CENTER)
+            self._items[coords] = self._draw_character_indicator(
+                character, tile_x * scale + center, tile_y * scale + center
+            )
 
     def _update_selection_overlay(self) -> None:
         """Draw selection rectangle around selected tile."""
@@ -173,44 +198,49 @@ class CharacterMode(EditorMode):
         """Draw character indicators on all character positions."""
         self._update_selection_overlay()
 
+        items = self._items = {}
+
+        scale, center = tile_transform(_CENTER)
         for (tile_x, tile_y), character in self.editor.characters.items():
-            self._draw_character_indicator(tile_x, tile_y, character)
+            items[tile_x, tile_y] = self._draw_character_indicator(
+                character, tile_x * scale + center, tile_y * scale + center
+            )
 
     def _draw_character_indicator(
         self,
-        tile_x: int,
-        tile_y: int,
-        character: Character
-    ) -> None:
-        """Draw a character indicator."""
+        character: Character,
+        cx: int,
+        cy: int
+    ) -> tuple[int, int]:
+        """
+        Draw a character indicator centered on canvas point (cx, cy).
+
+        Returns:
+            The (circle, label) canvas item ids.
+        """
         editor = self.editor
 
-        px = editor.world_to_canvas_x(tile_x)
-        py = editor.world_to_canvas_y(tile_y)
-
         # Draw a circle
-        cx = px + DISPLAY_SIZE // 2
-        cy = py + DISPLAY_SIZE // 2
-        radius = DISPLAY_SIZE // 3
-
-        editor.map_canvas.create_oval(
-            cx - radius, cy - radius,
-            cx + radius, cy + radius,
+        oval = editor.map_canvas.create_oval(
+            cx - _RADIUS, cy - _RADIUS,
+            cx + _RADIUS, cy + _RADIUS,
             fill="#009999",
             outline="#00ffff",
             width=2,
-            tags=("overlay", f"char_{tile_x}_{tile_y}")
+            tags="overlay"
         )
 
         # Draw name label below the circle
-        editor.map_canvas.create_text(
+        label = editor.map_canvas.create_text(
             cx, cy, # Approximately centered
             text=character.name,
             fill="#000000",
             font=("TkDefaultFont", 8),
-            tags=("overlay", f"char_{tile_x}_{tile_y}")
+            tags="overlay"
         )
 
+        return oval, label
+
     def build_panel(self, parent: tk.Frame) -> tk.Frame:
         """Build the character editing panel."""
         frame = tk.Frame(parent)
@@ -24,6 +24,9 @@ class ExamineMode(EditorMode):
         self._original_text: str | None = None  # For discard functionality
         self._text_widget: tk.Text | None = None
         self._char_count_var: tk.StringVar | None = None
+        self._last_len: int | None = None  # Text length last shown in the counter
+        self._text_update_pending: bool = False
+        self._suppress_modified: bool = False  # Next <<Modified>> is from our own truncation
 
     def get_name(self) -> str:
         return "Examine"
@@ -41,6 +44,10 @@ class ExamineMode(EditorMode):
         self._selected_coords = None
         self._original_text = None
 
+        if self._text_widget:
+            self._text_widget.delete("1.0", tk.END)
+        self._update_char_count()
+
     def on_map_click(self, world_x: int, world_y: int, event: tk.Event) -> None:
         """Select a tile and load its examine text."""
         coords = (world_x, world_y)
@@ -87,9 +94,14 @@ class ExamineMode(EditorMode):
         text = text[:MAX_EXAMINE_LENGTH]
 
         # Store None for empty string
-        tile.examine_text = text if text else None
-
         saved_coords = self._selected_coords
+        if text:
+            tile.examine_text = text
+            self.editor.examine_coords.add(saved_coords)
+        else:
+            tile.examine_text = None
+            self.editor.examine_coords.discard(saved_coords)
+
         self._deselect()
         self.editor.update_status(f"Saved examine text for ({saved_coords[0]}, {saved_coords[1]})")
 
@@ -119,35 +131,63 @@ class ExamineMode(EditorMode):
         self._update_char_count()
         self._update_selection_overlay()
 
-    def _update_char_count(self) -> None:
-        """Update the character count display."""
+    def _update_char_count(self, text: str | None = None) -> None:
+        """Update the character count display, fetching the text unless given."""
         if self._text_widget is None or self._char_count_var is None:
             return
 
-        text = self._text_widget.get("1.0", tk.END).rstrip()
+        if text is None:
+            text = self._text_widget.get("1.0", "end-1c").rstrip()
         count = len(text)
+        self._last_len = count
         self._char_count_var.set(f"{count}/{MAX_EXAMINE_LENGTH}")
 
     def _on_text_changed(self, event: tk.Event = None) -> None:
-        """Handle text changes - enforce max length and update counter."""
-        if self._text_widget is None:
+        """Handle text changes once the current burst of edits settles."""
+        text_widget = self._text_widget
+        if text_widget is None:
             return
 
-        text = self._text_widget.get("1.0", tk.END).rstrip()
+        # <<Modified>> also fires when the flag is cleared below; only a set
+        # flag means the buffer changed. Clearing it rearms the event.
+        if not text_widget.edit_modified():
+            return
+        text_widget.edit_modified(False)
 
-        # Enforce max length by truncating
-        if len(text) > MAX_EXAMINE_LENGTH:
-            cursor_pos = self._text_widget.index(tk.INSERT)
+        # Our own truncation already updated the counter; skip the re-check
+        if self._suppress_modified:
+            self._suppress_modified = False
+            return
 
-            self._text_widget.delete("1.0", tk.END)
-            self._text_widget.insert("1.0", text[:MAX_EXAMINE_LENGTH])
+        if self._text_update_pending:
+            return
+        self._text_update_pending = True
+        text_widget.after_idle(self._apply_text_change)
 
-            try:
-                self._text_widget.mark_set(tk.INSERT, cursor_pos)
-            except tk.TclError:
-                self._text_widget.mark_set(tk.INSERT, tk.END)
+    def _apply_text_change(self) -> None:
+        """Enforce max length and update counter."""
+        self._text_update_pending = False
 
-        self._update_char_count()
+        # The panel may have been rebuilt since this was scheduled
+        if self._text_widget is None or not self._text_widget.winfo_exists():
+            return
+
+        # One fetch serves both the length check and the counter
+        text = self._text_widget.get("1.0", "end-1c").rstrip()
+
+        # Edits that did not change the length need no work
+        if len(text) == self._last_len:
+            return
+
+        # Enforce max length by deleting just the overflow; only trailing
+        # whitespace is stripped, so the kept prefix matches the buffer.
+        # The insert mark stays put, or moves to the new end if it was cut.
+        if len(text) > MAX_EXAMINE_LENGTH:
+            text = text[:MAX_EXAMINE_LENGTH]
+            self._suppress_modified = True
+            self._text_widget.delete(f"1.0+{MAX_EXAMINE_LENGTH}c", tk.END)
+
+        self._update_char_count(text)
 
     def _update_selection_overlay(self) -> None:
         """Draw selection rectangle around selected tile."""
@@ -191,6 +231,7 @@ class ExamineMode(EditorMode):
 
         # Character count
         self._char_count_var = tk.StringVar(value=f"0/{MAX_EXAMINE_LENGTH}")
+        self._last_len = 0
         tk.Label(frame, textvariable=self._char_count_var).pack()
 
         # Text widget with scrollbar
@@ -211,7 +252,9 @@ class ExamineMode(EditorMode):
         scrollbar.config(command=self._text_widget.yview)
 
         # Bind events
-        self._text_widget.bind("<KeyRelease>", self._on_text_changed)
+        # <<Modified>> fires only when the buffer changes, unlike <KeyRelease>,
+        # which also fires for navigation and modifier keys
+        self._text_widget.bind("<<Modified>>", self._on_text_changed)
         self._text_widget.bind("<Return>", self._save_and_deselect)
         self._text_widget.bind("<Escape>", self._discard_and_deselect)
 
@@ -14,6 +14,9 @@ from mapper.tile import Tile
 if TYPE_CHECKING:
     from mapper.editor import Mapper
 
+# Drag painting is applied at most once per this many ms (about one frame)
+_PAINT_FLUSH_MS = 16
+
 
 class PaintTileMode(EditorMode):
     """Mode for painting tile sprites onto the map."""
@@ -21,6 +24,21 @@ class PaintTileMode(EditorMode):
     def __init__(self, editor: Mapper) -> None:
         super().__init__(editor)
         self.palette_canvas: tk.Canvas | None = None
+        self._tiles_per_row: int = 0  # Palette layout, from <Configure>; 0 until first laid out
+        self._highlight_item: int | None = None  # Brush rectangle on palette_canvas
+
+        # (x, y, brush) last painted in the current stroke; motion events
+        # repeat while the pointer stays inside one tile
+        self._last_paint: tuple[int, int, int] | None = None
+
+        # Drag paints waiting for the next flush: coords -> brush
+        self._pending_paints: dict[tuple[int, int], int] = {}
+        self._paint_flush_pending: bool = False
+
+        # Whole palette as one image, and what it was built from
+        self._mosaic: tk.PhotoImage | None = None
+        self._mosaic_source: dict[int, tk.PhotoImage] | None = None
+        self._mosaic_tiles_per_row: int = 0
 
     def get_name(self) -> str:
         return "Paint"
@@ -31,6 +49,9 @@ class PaintTileMode(EditorMode):
     def on_activate(self) -> None:
         self._update_brush_status()
 
+    def on_deactivate(self) -> None:
+        self._flush_paints()
+
     def _update_brush_status(self) -> None:
         """Update status bar with current brush info including defaults."""
         editor = self.editor
@@ -49,56 +70,60 @@ class PaintTileMode(EditorMode):
             self.editor.update_status(f"Brush: tile {brush}")
 
     def on_map_click(self, world_x: int, world_y: int, event: tk.Event) -> None:
-        self._paint_tile(world_x, world_y)
+        # A click starts a new stroke, so the map may have changed since the last one
+        self._flush_paints()
+        self._last_paint = (world_x, world_y, self.editor.brush)
+        self._paint_tile(world_x, world_y, self.editor.brush)
 
     def on_map_drag(self, world_x: int, world_y: int, event: tk.Event) -> None:
-        self._paint_tile(world_x, world_y)
+        brush = self.editor.brush
+        paint = (world_x, world_y, brush)
+        if paint == self._last_paint:
+            return
+        self._last_paint = paint
 
-    def _paint_tile(self, tile_x: int, tile_y: int) -> None:
-        """Paint the current brush at the given world coordinates."""
-        editor = self.editor
+        self._pending_paints[world_x, world_y] = brush
+        if not self._paint_flush_pending:
+            self._paint_flush_pending = True
+            self.editor.root.after(_PAINT_FLUSH_MS, self._flush_paints)
 
-        if not editor.tile_images:
+    def _flush_paints(self) -> None:
+        """Apply the drag paints queued since the last flush."""
+        self._paint_flush_pending = False
+        if not self._pending_paints:
             return
 
-        # Bounds check
-        if not (-WORLD_OFFSET <= tile_x < WORLD_OFFSET):
-            return
-        if not (-WORLD_OFFSET <= tile_y < WORLD_OFFSET):
-            return
+        # A tile crossed more than once keeps the brush it was last crossed with
+        for (tile_x, tile_y), brush in self._pending_paints.items():
+            self._paint_tile(tile_x, tile_y, brush)
+        self._pending_paints.clear()
 
-        coords = (tile_x, tile_y)
+    def _paint_tile(self, tile_x: int, tile_y: int, brush: int) -> None:
+        """Paint a brush at the given world coordinates."""
+        editor = self.editor
 
-        # Check if already painted with same tile
-        existing = editor.tiles.get(coords)
-        if existing and existing.sprite == editor.brush:
+        if not editor.tile_images:
             return
 
-        # Remove old tile image if present
-        editor.map_canvas.delete(f"maptile_{tile_x}_{tile_y}")
-
-        # Paint new tile
-        px = editor.world_to_canvas_x(tile_x)
-        py = editor.world_to_canvas_y(tile_y)
-        editor.map_canvas.create_image(
-            px, py,
-            anchor=tk.NW,
-            image=editor.tile_images[editor.brush],
-            tags=("maptile", f"maptile_{tile_x}_{tile_y}")
-        )
+        # Bounds check, then the already-painted check as a flat grid read;
+        # neither builds a coords tuple
+        if not (-WORLD_OFFSET <= tile_x < WORLD_OFFSET and -WORLD_OFFSET <= tile_y < WORLD_OFFSET):
+            return
+        if editor.sprite_at(tile_x, tile_y) == brush:
+            return
 
         # Get defaults for this brush (if any)
-        defaults = editor.tile_defaults.get(editor.brush)
+        defaults = editor.tile_defaults.get(brush)
         blocked = defaults.blocked if defaults else False
         examine_text = defaults.examine_text if defaults else None
 
         # Create new tile with defaults (overwrites any existing tile completely)
         # Note: spawns at this location are preserved
-        editor.tiles[coords] = Tile(
-            sprite=editor.brush,
+        editor.paint_tile(tile_x, tile_y, Tile(
+            sprite=brush,
             blocked=blocked,
             examine_text=examine_text
-        )
+        ))
 
     def build_panel(self, parent: tk.Frame) -> tk.Frame:
         """Build the tile palette panel."""
@@ -122,63 +147,111 @@ class PaintTileMode(EditorMode):
 
         self.palette_canvas.bind("<Button-1>", self._on_palette_click)
 
-        # Draw the palette after the widget is mapped
-        frame.after(50, self._refresh_palette)
+        # Draw the palette once the canvas has a size, and again whenever
+        # a resize changes how many tiles fit per row
+        self._tiles_per_row = 0
+        self._highlight_item = None
+        self.palette_canvas.bind("<Configure>", self._on_palette_configure)
 
         return frame
 
+    def _on_palette_configure(self, event: tk.Event) -> None:
+        """Recompute the palette layout from the canvas size; redraw if it changed."""
+        # Figure out how many tiles fit per row
+        canvas_width = event.width
+        if canvas_width < DISPLAY_SIZE:
+            canvas_width = 200  # Fallback
+
+        tiles_per_row = max(1, canvas_width // DISPLAY_SIZE)
+        if tiles_per_row != self._tiles_per_row:
+            self._tiles_per_row = tiles_per_row
+            self._refresh_palette()
+
     def _refresh_palette(self) -> None:
-        """Redraw the palette canvas with all tiles."""
-        if self.palette_canvas is None:
+        """
+        Redraw the palette canvas with all tiles.
+
+        Only needed when the layout or atlas changes; selecting a brush just
+        moves the highlight (see _highlight_brush).
+        """
+        if self.palette_canvas is None or not self._tiles_per_row:
             return
 
         self.palette_canvas.delete("all")
+        self._highlight_item = None
 
         editor = self.editor
         if not editor.tile_images:
             return
 
-        # Figure out how many tiles fit per row
-        self.palette_canvas.update_idletasks()
-        canvas_width = self.palette_canvas.winfo_width()
-        if canvas_width < DISPLAY_SIZE:
-            canvas_width = 200  # Fallback
-
-        tiles_per_row = max(1, canvas_width // DISPLAY_SIZE)
-        tile_count = len(editor.tile_images)
-        rows = (tile_count + tiles_per_row - 1) // tiles_per_row
-
-        for idx in range(tile_count):
-            px = (idx % tiles_per_row) * DISPLAY_SIZE
-            py = (idx // tiles_per_row) * DISPLAY_SIZE
+        mosaic = self._get_mosaic(self._tiles_per_row)
 
-            self.palette_canvas.create_image(
-                px, py,
-                anchor=tk.NW,
-                image=editor.tile_images[idx],
-                tags=f"tile_{idx}"
-            )
+        self.palette_canvas.create_image(0, 0, anchor=tk.NW, image=mosaic)
 
         # Highlight current brush
-        self._highlight_brush(tiles_per_row)
+        self._highlight_brush()
 
         # Update scroll region
         self.palette_canvas.configure(
-            scrollregion=(0, 0, tiles_per_row * DISPLAY_SIZE, rows * DISPLAY_SIZE)
+            scrollregion=(0, 0, mosaic.width(), mosaic.height())
+        )
+
+    def _get_mosaic(self, tiles_per_row: int) -> tk.PhotoImage:
+        """
+        Return all tiles laid out as one palette image.
+
+        The image is rebuilt only when the atlas or the row width changes, so
+        redrawing the palette is a single canvas item either way.
+        """
+        tile_images = self.editor.tile_images
+        if (
+            self._mosaic is not None
+            and self._mosaic_source is tile_images
+            and self._mosaic_tiles_per_row == tiles_per_row
+        ):
+            return self._mosaic
+
+        tile_count = len(tile_images)
+        rows = (tile_count + tiles_per_row - 1) // tiles_per_row
+
+        mosaic = tk.PhotoImage(
+            master=self.editor.root,
+            width=tiles_per_row * DISPLAY_SIZE,
+            height=rows * DISPLAY_SIZE
+        )
+
+        # One script for all the copies, so the blits run in a single Python
+        # -> Tcl round trip. Tk image names (pyimageN) need no quoting.
+        script = "\n".join(
+            f"{mosaic} copy {tile_images[idx]} -to "
+            f"{(idx % tiles_per_row) * DISPLAY_SIZE} {(idx // tiles_per_row) * DISPLAY_SIZE}"
+            for idx in range(tile_count)
         )
+        mosaic.tk.eval(script)
+
+        self._mosaic = mosaic
+        self._mosaic_source = tile_images
+        self._mosaic_tiles_per_row = tiles_per_row
+        return mosaic
 
-    def _highlight_brush(self, tiles_per_row: int) -> None:
-        """Draw selection rectangle around current brush tile."""
+    def _highlight_brush(self) -> None:
+        """Draw selection rectangle around current brush tile, moving it if already drawn."""
         if self.palette_canvas is None:
             return
 
-        self.palette_canvas.delete("highlight")
-
         editor = self.editor
+        tiles_per_row = self._tiles_per_row
         px = (editor.brush % tiles_per_row) * DISPLAY_SIZE
         py = (editor.brush // tiles_per_row) * DISPLAY_SIZE
 
-        self.palette_canvas.create_rectangle(
+        if self._highlight_item is not None:
+            self.palette_canvas.coords(
+                self._highlight_item,
+                px, py, px + DISPLAY_SIZE, py + DISPLAY_SIZE
+            )
+            return
+
+        self._highlight_item = self.palette_canvas.create_rectangle(
             px, py,
             px + DISPLAY_SIZE, py + DISPLAY_SIZE,
             outline="#ffff00",
@@ -190,12 +263,10 @@ class PaintTileMode(EditorMode):
         """Select a tile from the palette as the current brush."""
         editor = self.editor
 
-        if not editor.tile_images:
+        tiles_per_row = self._tiles_per_row
+        if not editor.tile_images or not tiles_per_row:
             return
 
-        canvas_width = self.palette_canvas.winfo_width()
-        tiles_per_row = max(1, canvas_width // DISPLAY_SIZE)
-
         # Convert canvas coords to tile index
         cx = self.palette_canvas.canvasx(event.x)
         cy = self.palette_canvas.canvasy(event.y)
@@ -206,5 +277,5 @@ class PaintTileMode(EditorMode):
 
         if idx in editor.tile_images:
             editor.brush = idx
-            self._highlight_brush(tiles_per_row)
+            self._highlight_brush()
             self._update_brush_status()
@@ -10,6 +10,34 @@ from tkinter import messagebox
 from mapper.constants import DISPLAY_SIZE
 from mapper.modes.base import EditorMode
 from mapper.monsterspawn import MonsterSpawn
+from mapper.overlay import spawn_draw_specs, tile_transform
+
+# Indicator diamond, relative to the tile's top-left corner
+_CENTER = DISPLAY_SIZE // 2
+_SIZE = DISPLAY_SIZE // 3  # Center to each point
+# Diamond points (top, right, bottom, left) as x, y offsets from its center
+_DIAMOND_OFFSETS = (0, -_SIZE, _SIZE, 0, 0, _SIZE, -_SIZE, 0)
+_LABEL_DY = _SIZE + 8  # Name label center, below the diamond
+
+# Tcl procedure that draws a whole batch of spawn indicators in one call
+# from Python, matching _draw_spawn_indicator. Takes the canvas path and a
+# flat list of center x, center y, name triples; returns the diamond and
+# label item ids in the same order.
+_DRAW_SPAWNS_PROC = "mapper_draw_spawns"
+_DRAW_SPAWNS_TCL = f"""
+proc {_DRAW_SPAWNS_PROC} {{canvas specs}} {{
+    set ids {{}}
+    foreach {{cx cy name}} $specs {{
+        lappend ids [$canvas create polygon \\
+            $cx [expr {{$cy - {_SIZE}}}] [expr {{$cx + {_SIZE}}}] $cy \\
+            $cx [expr {{$cy + {_SIZE}}}] [expr {{$cx - {_SIZE}}}] $cy \\
+            -fill #9900ff -outline #cc66ff -width 2 -tags overlay]
+        lappend ids [$canvas create text $cx [expr {{$cy + {_LABEL_DY}}}] \\
+            -text $name -fill #cc66ff -font {{TkDefaultFont 8}} -tags overlay]
+    }}
+    return $ids
+}}
+"""
 
 
 class SpawnMode(EditorMode):
@@ -19,6 +47,10 @@ class SpawnMode(EditorMode):
         super().__init__(editor)
         self._selected_coords: tuple[int, int] | None = None
 
+        # (diamond, label) items per spawn drawn since the last render_overlay
+        self._spawn_items: dict[tuple[int, int], tuple[int, int]] = {}
+        self._selection_item: int | None = None
+
         # Panel widgets
         self._coords_var: tk.StringVar | None = None
         self._name_var: tk.StringVar | None = None
@@ -41,6 +73,8 @@ class SpawnMode(EditorMode):
 
     def on_deactivate(self) -> None:
         self._selected_coords = None
+        self._clear_fields()
+        self._update_button_states()
 
     def on_map_click(self, world_x: int, world_y: int, event: tk.Event) -> None:
         """Select a tile for spawn editing."""
@@ -134,7 +168,7 @@ class SpawnMode(EditorMode):
         )
 
         self._update_button_states()
-        self._refresh_overlay()
+        self._upsert_spawn_item(self._selected_coords)
 
         spawn_count = len(self.editor.spawns)
         self.editor.update_status(
@@ -154,33 +188,57 @@ class SpawnMode(EditorMode):
 
         self._load_spawn_data()  # Refresh fields (will show defaults)
         self._update_button_states()
-        self._refresh_overlay()
+        self._delete_spawn_item(self._selected_coords)
 
         spawn_count = len(self.editor.spawns)
         self.editor.update_status(
             f"Deleted spawn '{name}' | {spawn_count} remaining"
         )
 
-    def _refresh_overlay(self) -> None:
-        """Refresh the spawn overlay."""
-        self.editor.map_canvas.delete("overlay")
-        self.render_overlay()
+    def _upsert_spawn_item(self, coords: tuple[int, int]) -> None:
+        """Draw the indicator for the spawn at coords, or relabel it if already drawn."""
+        spawn = self.editor.spawns[coords]
+        items = self._spawn_items.get(coords)
+
+        if items is not None:
+            # Position and shape are fixed per tile; only the name can change
+            self.editor.map_canvas.itemconfigure(items[1], text=spawn.name)
+        else:
+            tile_x, tile_y = coords
+            scale, center = tile_transform(_CENTER)
+            self._spawn_items[coords] = self._draw_spawn_indicator(
+                spawn, tile_x * scale + center, tile_y * scale + center
+            )
+
+    def _delete_spawn_item(self, coords: tuple[int, int]) -> None:
+        """Remove the indicator for a deleted spawn."""
+        items = self._spawn_items.pop(coords, None)
+        if items is not None:
+            self.editor.map_canvas.delete(*items)
 
     def _update_selection_overlay(self) -> None:
-        """Draw selection rectangle around selected tile."""
+        """Draw selection rectangle around selected tile, moving it if already drawn."""
         editor = self.editor
 
-        # Clear old selection
-        editor.map_canvas.delete("selection")
-
         if self._selected_coords is None:
+            if self._selection_item is not None:
+                editor.map_canvas.delete(self._selection_item)
+                self._selection_item = None
             return
 
         tile_x, tile_y = self._selected_coords
-        px = editor.world_to_canvas_x(tile_x)
-        py = editor.world_to_canvas_y(tile_y)
+        scale, offset = tile_transform()
+        px = tile_x * scale + offset
+        py = tile_y * scale + offset
+
+        if self._selection_item is not None:
+            editor.map_canvas.coords(
+                self._selection_item,
+                px, py, px + DISPLAY_SIZE, py + DISPLAY_SIZE
+            )
+            return
 
-        editor.map_canvas.create_rectangle(
+        self._selection_item = editor.map_canvas.create_rectangle(
             px, py,
             px + DISPLAY_SIZE, py + DISPLAY_SIZE,
             outline="#ff00ff",  # Magenta for spawn mode
@@ -190,48 +248,63 @@ class SpawnMode(EditorMode):
 
     def render_overlay(self) -> None:
         """Draw spawn indicators on all spawn points."""
+        self._selection_item = None
         self._update_selection_overlay()
 
-        for (tile_x, tile_y), spawn in self.editor.spawns.items():
-            self._draw_spawn_indicator(tile_x, tile_y, spawn)
+        items = self._spawn_items = {}
+        spawns = self.editor.spawns
+        if not spawns:
+            return
+
+        # Create every item in one Python -> Tcl round trip
+        canvas = self.editor.map_canvas
+        if not canvas.tk.call("info", "commands", _DRAW_SPAWNS_PROC):
+            canvas.tk.eval(_DRAW_SPAWNS_TCL)
+        ids = iter(map(int, canvas.tk.splitlist(
+            canvas.tk.call(_DRAW_SPAWNS_PROC, canvas, tuple(spawn_draw_specs(spawns)))
+        )))
+
+        for coords, diamond, label in zip(spawns, ids, ids):
+            items[coords] = (diamond, label)
 
     def _draw_spawn_indicator(
         self,
-        tile_x: int,
-        tile_y: int,
-        spawn: MonsterSpawn
-    ) -> None:
-        """Draw a spawn point indicator."""
+        spawn: MonsterSpawn,
+        cx: int,
+        cy: int
+    ) -> tuple[int, int]:
+        """
+        Draw a spawn point indicator centered on canvas point (cx, cy).
+
+        Returns:
+            The (diamond, label) canvas item ids.
+        """
         editor = self.editor
-
-        px = editor.world_to_canvas_x(tile_x)
-        py = editor.world_to_canvas_y(tile_y)
+        dx0, dy0, dx1, dy1, dx2, dy2, dx3, dy3 = _DIAMOND_OFFSETS
 
         # Draw a diamond shape
-        cx = px + DISPLAY_SIZE // 2
-        cy = py + DISPLAY_SIZE // 2
-        size = DISPLAY_SIZE // 3
-
-        editor.map_canvas.create_polygon(
-            cx, cy - size,      # Top
-            cx + size, cy,      # Right
-            cx, cy + size,      # Bottom
-            cx - size, cy,      # Left
+        diamond = editor.map_canvas.create_polygon(
+            cx + dx0, cy + dy0,
+            cx + dx1, cy + dy1,
+            cx + dx2, cy + dy2,
+            cx + dx3, cy + dy3,
             fill="#9900ff",
             outline="#cc66ff",
             width=2,
-            tags=("overlay", f"spawn_{tile_x}_{tile_y}")
+            tags="overlay"
         )
 
         # Draw name label below the diamond
-        editor.map_canvas.create_text(
-            cx, cy + size + 8,
+        label = editor.map_canvas.create_text(
+            cx, cy + _LABEL_DY,
             text=spawn.name,
             fill="#cc66ff",
             font=("TkDefaultFont", 8),
-            tags=("overlay", f"spawn_{tile_x}_{tile_y}")
+            tags="overlay"
         )
 
+        return diamond, label
+
     def build_panel(self, parent: tk.Frame) -> tk.Frame:
         """Build the spawn editing panel."""
         frame = tk.Frame(parent)
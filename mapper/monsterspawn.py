@@ -7,7 +7,7 @@ Represents a spawn point for monsters on the map.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class MonsterSpawn:
     """
     Represents a monster spawn point.
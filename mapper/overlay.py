@@ -0,0 +1,44 @@
+"""
+Canvas geometry for map overlays.
+
+Per-item coordinate math for overlays that are drawn in bulk lives here,
+away from Tk, so it can be compiled with mypyc alongside the data model
+(see setup.py). It also runs unchanged as plain Python.
+"""
+
+from __future__ import annotations
+
+from mapper.constants import DISPLAY_SIZE, WORLD_PIXEL_OFFSET
+from mapper.monsterspawn import MonsterSpawn
+
+
+def tile_transform(inset: int = 0) -> tuple[int, int]:
+    """
+    Return (scale, offset) such that world * scale + offset is the canvas
+    pixel inset pixels right of / below a tile's top-left corner.
+
+    The same pair serves both axes. world_to_canvas is affine, so loops
+    over many tiles apply it directly instead of converting each axis.
+    """
+    return DISPLAY_SIZE, WORLD_PIXEL_OFFSET + inset
+
+
+def spawn_draw_specs(spawns: dict[tuple[int, int], MonsterSpawn]) -> list[int | str]:
+    """
+    Build the argument list for drawing every spawn indicator in one batch.
+
+    Args:
+        spawns: Spawns keyed by world tile coordinates.
+
+    Returns:
+        Flat list of (canvas center x, canvas center y, name) triples, in
+        the iteration order of spawns.
+    """
+    scale, center = tile_transform(DISPLAY_SIZE // 2)
+
+    specs: list[int | str] = []
+    for (tile_x, tile_y), spawn in spawns.items():
+        specs.append(tile_x * scale + center)
+        specs.append(tile_y * scale + center)
+        specs.append(spawn.name)
+    return specs
@@ -10,7 +10,7 @@ All per-tile attributes are defined here. To add a new attribute:
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """
     Represents a single map tile and all its attributes.
@@ -12,15 +12,26 @@ File format (.tiles):
     0	0	Grass
     15	1	A stone wall
     32	0	A sealed wooden barrel
+
+Parsed defaults, and any warnings the parse produced, are cached as JSON
+next to the .tiles file (terrain.tiles.cache) and reused while the .tiles
+file's mtime and size are unchanged.
 """
 
 from __future__ import annotations
 
+import csv
+import json
 import os
 from dataclasses import dataclass
 
+from mapper.constants import BLANK_OR_COMMENT_START
+
+_CACHE_SUFFIX = ".cache"
+_CACHE_VERSION = 2  # Bump when TileDefaults or the parse rules change
+
 
-@dataclass
+@dataclass(slots=True)
 class TileDefaults:
     """Default values for a tile sprite."""
     blocked: bool = False
@@ -48,25 +59,101 @@ def load_tile_defaults(atlas_path: str) -> dict[int, TileDefaults]:
     """
     tiles_path = get_defaults_path(atlas_path)
 
-    if not os.path.exists(tiles_path):
+    try:
+        st = os.stat(tiles_path)
+    except OSError:
         return {}
 
+    cache_key = [_CACHE_VERSION, st.st_mtime_ns, st.st_size]
+    cached = _read_cache(tiles_path, cache_key)
+    if cached is not None:
+        defaults, warnings = cached
+    else:
+        warnings = []
+        defaults = _parse_tile_defaults(tiles_path, warnings)
+        _write_cache(tiles_path, cache_key, defaults, warnings)
+
+    for warning in warnings:
+        print(warning)
+
+    return defaults
+
+
+def _read_cache(
+    tiles_path: str,
+    cache_key: list[int]
+) -> tuple[dict[int, TileDefaults], list[str]] | None:
+    """Return the cached (defaults, warnings) for tiles_path if they match cache_key, else None."""
+    try:
+        with open(tiles_path + _CACHE_SUFFIX, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+
+        if cache["key"] != cache_key:
+            return None
+
+        defaults = {
+            int(index): TileDefaults(
+                blocked=bool(blocked),
+                examine_text=text if isinstance(text, str) else None
+            )
+            for index, blocked, text in cache["rows"]
+        }
+        warnings = [str(warning) for warning in cache["warnings"]]
+    except (OSError, ValueError, TypeError, KeyError):
+        # Missing, unreadable or malformed: parse instead
+        return None
+
+    return defaults, warnings
+
+
+def _write_cache(
+    tiles_path: str,
+    cache_key: list[int],
+    defaults: dict[int, TileDefaults],
+    warnings: list[str]
+) -> None:
+    """Store parsed defaults and warnings next to tiles_path; failures are ignored."""
+    cache = {
+        "key": cache_key,
+        "rows": [
+            [index, tile.blocked, tile.examine_text]
+            for index, tile in defaults.items()
+        ],
+        "warnings": warnings,
+    }
+
+    try:
+        with open(tiles_path + _CACHE_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, separators=(",", ":"))
+    except OSError:
+        # The cache is only a speedup (e.g. the atlas directory may be read-only)
+        pass
+
+
+def _parse_tile_defaults(tiles_path: str, warnings: list[str]) -> dict[int, TileDefaults]:
+    """Parse a .tiles file, appending a warning for each malformed line."""
     defaults: dict[int, TileDefaults] = {}
 
-    with open(tiles_path, "r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.rstrip("\n\r")
+    with open(tiles_path, "r", encoding="utf-8", newline="") as f:
+        # The C reader does the line and tab splitting; QUOTE_NONE keeps
+        # quote characters in examine text literal
+        reader = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+
+        for parts in reader:
+            line_num = reader.line_num
 
             # Skip empty lines and comments
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
+            if not parts:
                 continue
+            first = parts[0]
+            if not first or first[0] in BLANK_OR_COMMENT_START:
+                stripped = "\t".join(parts).strip()
+                if not stripped or stripped.startswith("#"):
+                    continue
 
-            # Parse tab-delimited: index, blocked, examine_text
-            parts = line.split("\t")
-
+            # Tab-delimited: index, blocked, examine_text
             if len(parts) < 2:
-                print(f"Warning {tiles_path}:{line_num}: insufficient fields")
+                warnings.append(f"Warning {tiles_path}:{line_num}: insufficient fields")
                 continue
 
             try:
@@ -79,6 +166,6 @@ def load_tile_defaults(atlas_path: str) -> dict[int, TileDefaults]:
                     examine_text=examine_text
                 )
             except ValueError as e:
-                print(f"Warning {tiles_path}:{line_num}: failed to parse: {e}")
+                warnings.append(f"Warning {tiles_path}:{line_num}: failed to parse: {e}")
 
     return defaults
@@ -0,0 +1,39 @@
+"""
+Optional build script for the Mapper application.
+
+The editor runs straight from source (python -m mapper). When mypy is
+installed, the data model and map I/O modules are additionally compiled to
+C extensions with mypyc, which speeds up loading and saving large maps and
+bulk overlay drawing:
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+Without mypy this falls back to a plain pure-Python install.
+"""
+
+from setuptools import find_packages, setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify([
+        # The repository root is itself a package (__init__.py); without this
+        # mypy sees every module under two different names
+        "--explicit-package-bases",
+        "mapper/constants.py",
+        "mapper/tile.py",
+        "mapper/monsterspawn.py",
+        "mapper/character.py",
+        "mapper/map_io.py",
+        "mapper/overlay.py",
+    ])
+
+setup(
+    name="mapper",
+    version="0.2.0",
+    packages=find_packages(include=["mapper", "mapper.*"]),
+    ext_modules=ext_modules,
+)